@@ -6,6 +6,7 @@ This file configures pytest with custom markers, fixtures, and command-line opti
 
 import pytest
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -21,6 +22,12 @@ def pytest_addoption(parser):
         default=None,
         help="Serial port for Flipper Zero (auto-detect if not specified)"
     )
+    parser.addoption(
+        "--flipper-ports",
+        action="store",
+        default=None,
+        help="Comma-separated Flipper ports, one per pytest-xdist worker"
+    )
     parser.addoption(
         "--flipper-required",
         action="store_true",
@@ -37,6 +44,11 @@ def pytest_addoption(parser):
 
 def pytest_configure(config):
     """Configure pytest with custom markers."""
+    # Guard against double registration (and duplicate log handlers)
+    if getattr(config, "_flock_configured", False):
+        return
+    config._flock_configured = True
+
     config.addinivalue_line(
         "markers",
         "flipper_required: mark test as requiring a connected Flipper Zero"
@@ -55,27 +67,51 @@ def pytest_configure(config):
         logging.getLogger("flock_protocol").setLevel(logging.DEBUG)
         logging.getLogger("flipper_connection").setLevel(logging.DEBUG)
 
+    # Resolve the Flipper port once per session; enumeration (and the
+    # heartbeat probe in dual CDC mode) is too slow to repeat per fixture
+    config._flock_port = config.getoption("--flipper-port")
+    if config._flock_port is None and config.getoption("--flipper-ports"):
+        config._flock_port = _worker_port(config.getoption("--flipper-ports"))
+    if config._flock_port is None and config.getoption("--flipper-required"):
+        from flipper_connection import FlipperConnection
+        config._flock_port = FlipperConnection.find_flipper_port()
+
+
+def _worker_port(ports_option):
+    """Pick this xdist worker's port so each worker owns one device."""
+    ports = [p.strip() for p in ports_option.split(",") if p.strip()]
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    index = int(worker[2:])
+    if index >= len(ports):
+        raise pytest.UsageError(
+            f"xdist worker {worker} has no device; --flipper-ports lists {len(ports)}"
+        )
+    return ports[index]
+
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection based on options."""
-    if not config.getoption("--flipper-required"):
-        # Skip flipper_required tests if flag not provided
-        skip_flipper = pytest.mark.skip(reason="need --flipper-required option to run")
-        for item in items:
-            if "flipper_required" in item.keywords:
-                item.add_marker(skip_flipper)
+    if config.getoption("--flipper-required"):
+        return
+
+    # Deselect flipper_required tests up front if flag not provided, so
+    # hardware-free runs don't carry dozens of skipped items through setup
+    selected, deselected = [], []
+    for item in items:
+        if item.get_closest_marker("flipper_required") is not None:
+            deselected.append(item)
+        else:
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
 
 
 @pytest.fixture(scope="session")
 def flipper_port(request):
-    """Get Flipper port from command line or auto-detect."""
-    port = request.config.getoption("--flipper-port")
-    if port:
-        return port
-
-    # Auto-detect
-    from flipper_connection import FlipperConnection
-    return FlipperConnection.find_flipper_port()
+    """Get Flipper port from command line or the auto-detect probe in pytest_configure."""
+    return request.config._flock_port
 
 
 @pytest.fixture(scope="session")
@@ -84,9 +120,9 @@ def flipper_available(flipper_port):
     return flipper_port is not None
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def flipper_connection(flipper_port, flipper_available):
-    """Create module-scoped Flipper connection."""
+    """Create session-scoped Flipper connection shared by all test modules."""
     if not flipper_available:
         pytest.skip("Flipper Zero not connected")
 
@@ -95,6 +131,7 @@ def flipper_connection(flipper_port, flipper_available):
     conn = FlipperConnection(port=flipper_port, auto_reconnect=False)
     try:
         conn.connect()
+        conn.enable_low_latency()
         yield conn
     except FlipperConnectionError as e:
         pytest.skip(f"Failed to connect to Flipper: {e}")
@@ -102,25 +139,116 @@ def flipper_connection(flipper_port, flipper_available):
         conn.disconnect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client(flipper_connection):
-    """Create test client with existing connection."""
+    """Create session-scoped test client with existing connection."""
     from flipper_connection import FlipperTestClient
     return FlipperTestClient(flipper_connection)
 
 
+@pytest.fixture(autouse=True)
+def _drain_rx_queue(request):
+    """Drop responses left over from the previous test on the shared connection."""
+    if "flipper_connection" in request.fixturenames:
+        request.getfixturevalue("flipper_connection").clear_rx_queue()
+
+
+# ============================================================================
+# Pre-built request messages
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def heartbeat_msg():
+    """Serialized heartbeat request, built once per session."""
+    from flock_protocol import FlockProtocol
+    return FlockProtocol.create_heartbeat()
+
+
+@pytest.fixture(scope="session")
+def status_request_msg():
+    """Serialized status request, built once per session."""
+    from flock_protocol import FlockProtocol
+    return FlockProtocol.create_status_request()
+
+
+@pytest.fixture(scope="session")
+def wifi_scan_request_msg():
+    """Serialized WiFi scan request, built once per session."""
+    from flock_protocol import FlockProtocol
+    return FlockProtocol.create_wifi_scan_request()
+
+
+@pytest.fixture(scope="session")
+def subghz_scan_request_msg():
+    """Serialized full-band Sub-GHz scan request, built once per session."""
+    from flock_protocol import FlockProtocol
+    return FlockProtocol.create_subghz_scan_request()
+
+
+@pytest.fixture(scope="session")
+def ble_scan_request_msg():
+    """Serialized BLE scan request, built once per session."""
+    from flock_protocol import FlockProtocol
+    return FlockProtocol.create_ble_scan_request()
+
+
+@pytest.fixture(scope="session")
+def ir_scan_request_msg():
+    """Serialized IR scan request, built once per session."""
+    from flock_protocol import FlockProtocol
+    return FlockProtocol.create_ir_scan_request()
+
+
+@pytest.fixture(scope="session")
+def nfc_scan_request_msg():
+    """Serialized NFC scan request, built once per session."""
+    from flock_protocol import FlockProtocol
+    return FlockProtocol.create_nfc_scan_request()
+
+
+@pytest.fixture(scope="session")
+def large_payload_msg():
+    """Sub-GHz replay message carrying a 256-byte 0xAA payload, built once per session."""
+    from flock_protocol import FlockProtocol, FlockMessageType
+    return FlockProtocol.create_message(FlockMessageType.SUBGHZ_REPLAY_TX, b"\xaa" * 256)
+
+
+@pytest.fixture(scope="session")
+def mixed_messages_blob(heartbeat_msg, status_request_msg, wifi_scan_request_msg,
+                        subghz_scan_request_msg, ble_scan_request_msg, nfc_scan_request_msg):
+    """Ten rounds of mixed request types concatenated into a single write."""
+    return b''.join([
+        heartbeat_msg,
+        status_request_msg,
+        wifi_scan_request_msg,
+        subghz_scan_request_msg,
+        ble_scan_request_msg,
+        nfc_scan_request_msg,
+    ]) * 10
+
+
 # ============================================================================
 # Test fixtures for protocol testing
 # ============================================================================
 
-@pytest.fixture
+# Raw byte fields for the sample records, built once at import time
+_SAMPLE_BSSID_1 = b"\xaa\xbb\xcc\xdd\xee\x01"
+_SAMPLE_BSSID_2 = b"\xaa\xbb\xcc\xdd\xee\x02"
+_SAMPLE_BSSID_3 = b"\xaa\xbb\xcc\xdd\xee\x03"
+_SAMPLE_NFC_UID_CLASSIC = b"\x04\x12\x34\x56\x78\x9a\xbc" + b"\x00" * 3
+_SAMPLE_NFC_UID_ULTRALIGHT = b"\x04\x11\x22\x33" + b"\x00" * 6
+_SAMPLE_ATQA_CLASSIC = b"\x04\x00"
+_SAMPLE_ATQA_ULTRALIGHT = b"\x44\x00"
+
+
+@pytest.fixture(scope="session")
 def sample_wifi_networks():
-    """Sample WiFi network data for testing."""
+    """Sample WiFi network data for testing (shared, do not mutate)."""
     from flock_protocol import FlockWifiNetwork, WifiSecurityType
-    return [
+    return (
         FlockWifiNetwork(
             ssid="TestNetwork1",
-            bssid=bytes([0xAA, 0xBB, 0xCC, 0xDD, 0xEE, 0x01]),
+            bssid=_SAMPLE_BSSID_1,
             rssi=-50,
             channel=1,
             security=WifiSecurityType.WPA2,
@@ -128,7 +256,7 @@ def sample_wifi_networks():
         ),
         FlockWifiNetwork(
             ssid="TestNetwork2",
-            bssid=bytes([0xAA, 0xBB, 0xCC, 0xDD, 0xEE, 0x02]),
+            bssid=_SAMPLE_BSSID_2,
             rssi=-65,
             channel=6,
             security=WifiSecurityType.WPA3,
@@ -136,20 +264,20 @@ def sample_wifi_networks():
         ),
         FlockWifiNetwork(
             ssid="HiddenNet",
-            bssid=bytes([0xAA, 0xBB, 0xCC, 0xDD, 0xEE, 0x03]),
+            bssid=_SAMPLE_BSSID_3,
             rssi=-80,
             channel=11,
             security=WifiSecurityType.WPA2,
             hidden=True
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_subghz_detections():
-    """Sample Sub-GHz detection data for testing."""
+    """Sample Sub-GHz detection data for testing (shared, do not mutate)."""
     from flock_protocol import FlockSubGhzDetection, SubGhzModulation
-    return [
+    return (
         FlockSubGhzDetection(
             frequency=433920000,
             rssi=-45,
@@ -168,28 +296,28 @@ def sample_subghz_detections():
             protocol_id=5,
             protocol_name="CAME"
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_nfc_detections():
-    """Sample NFC detection data for testing."""
+    """Sample NFC detection data for testing (shared, do not mutate)."""
     from flock_protocol import FlockNfcDetection
-    return [
+    return (
         FlockNfcDetection(
-            uid=bytes([0x04, 0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC] + [0] * 3),
+            uid=_SAMPLE_NFC_UID_CLASSIC,
             uid_len=7,
             nfc_type=1,
             sak=0x08,
-            atqa=bytes([0x04, 0x00]),
+            atqa=_SAMPLE_ATQA_CLASSIC,
             type_name="MIFARE Classic"
         ),
         FlockNfcDetection(
-            uid=bytes([0x04, 0x11, 0x22, 0x33] + [0] * 6),
+            uid=_SAMPLE_NFC_UID_ULTRALIGHT,
             uid_len=4,
             nfc_type=1,
             sak=0x00,
-            atqa=bytes([0x44, 0x00]),
+            atqa=_SAMPLE_ATQA_ULTRALIGHT,
             type_name="Ultralight"
         ),
-    ]
+    )
@@ -7,6 +7,7 @@ of the Flock Bridge FAP via USB communication.
 Run with: pytest tests/e2e/test_subghz_ble.py -v --flipper-required
 """
 
+import asyncio
 import pytest
 import time
 import struct
@@ -21,45 +22,46 @@ from flock_protocol import (
     FLOCK_PROTOCOL_VERSION, FLOCK_HEADER_SIZE
 )
 from flipper_connection import (
-    FlipperConnection, FlipperTestClient, FlipperConnectionError, FlipperTimeoutError
+    FlipperConnectionError, FlipperTimeoutError
 )
 
+# Arg-less request frames never change; encode them once per module
+_HEARTBEAT_FRAME = FlockProtocol.create_heartbeat()
+_BLE_SCAN_FRAME = FlockProtocol.create_ble_scan_request()
+_SUBGHZ_SCAN_FRAME = FlockProtocol.create_subghz_scan_request()
+
+
+def _drain_until_idle(conn, quiet_ms=50, hard_timeout=0.5):
+    """Wait for the FAP to go quiet after a request, returning whatever it sent."""
+    return conn.receive_all(hard_timeout, idle_timeout=quiet_ms / 1000)
+
 
 # ============================================================================
-# Fixtures
+# Status Tests
 # ============================================================================
 
-@pytest.fixture(scope="module")
-def flipper_available():
-    """Check if Flipper Zero is available."""
-    port = FlipperConnection.find_flipper_port()
-    return port is not None
-
+@pytest.fixture(scope="class")
+def status_snapshot(test_client):
+    """Single status response shared by the structural status checks."""
+    return test_client.get_status()
 
-@pytest.fixture(scope="module")
-def flipper_connection(flipper_available, request):
-    """Create a shared Flipper connection for the test module."""
-    if not flipper_available:
-        pytest.skip("Flipper Zero not connected")
 
-    # Check for --flipper-required flag
-    if request.config.getoption("--flipper-required", default=False) is False:
-        if not hasattr(request.config, '_flipper_required_warned'):
-            request.config._flipper_required_warned = True
-        pytest.skip("need --flipper-required option to run")
+@pytest.mark.flipper_required
+class TestStatusInvariants:
+    """Test scanner status fields against one status response."""
 
-    conn = FlipperConnection(auto_reconnect=False)
-    try:
-        conn.connect()
-        yield conn
-    finally:
-        conn.disconnect()
+    def test_status_snapshot(self, status_snapshot):
+        """Test SubGHz and BLE status invariants on a single status response."""
+        status = status_snapshot
 
+        assert status.subghz_ready is True, "SubGHz scanner should be ready"
+        # Detection count should be accessible (may be 0 if no signals)
+        assert status.subghz_detection_count >= 0, "Detection count should be non-negative"
 
-@pytest.fixture
-def test_client(flipper_connection):
-    """Create a test client using the shared connection."""
-    return FlipperTestClient(flipper_connection)
+        # Note: BLE may not always be ready due to Bluetooth Serial usage
+        # This is expected behavior - just verify we get a valid response
+        assert isinstance(status.ble_ready, bool), "BLE ready should be boolean"
+        assert status.ble_scan_count >= 0, "BLE scan count should be non-negative"
 
 
 # ============================================================================
@@ -70,11 +72,6 @@ def test_client(flipper_connection):
 class TestSubGhzScanner:
     """Test Sub-GHz scanner functionality over USB."""
 
-    def test_subghz_ready_status(self, test_client):
-        """Test that SubGHz scanner reports ready in status."""
-        status = test_client.get_status()
-        assert status.subghz_ready is True, "SubGHz scanner should be ready"
-
     def test_subghz_scan_request_accepted(self, flipper_connection):
         """Test SubGHz scan request is accepted without error."""
         msg = FlockProtocol.create_subghz_scan_request(433000000, 434000000)
@@ -89,47 +86,20 @@ class TestSubGhzScanner:
         except FlipperTimeoutError:
             pass  # No response is acceptable (scanning in background)
 
-    def test_subghz_frequency_range_315mhz(self, flipper_connection):
-        """Test SubGHz scan at 315 MHz (US garage doors)."""
-        msg = FlockProtocol.create_subghz_scan_request(314000000, 316000000)
+    @pytest.mark.parametrize("freq_start,freq_end", [
+        pytest.param(314000000, 316000000, id="315mhz"),    # US garage doors
+        pytest.param(433000000, 435000000, id="433mhz"),    # EU remotes
+        pytest.param(867000000, 869000000, id="868mhz"),    # EU devices
+        pytest.param(914000000, 916000000, id="915mhz"),    # US ISM band
+        pytest.param(300000000, 928000000, id="full_band"),
+    ])
+    def test_subghz_frequency_range(self, flipper_connection, freq_start, freq_end):
+        """Test SubGHz scan requests across the supported bands."""
+        msg = FlockProtocol.create_subghz_scan_request(freq_start, freq_end)
         flipper_connection.send(msg)
-        time.sleep(0.5)
+        _drain_until_idle(flipper_connection)
         # Just verify no crash
 
-    def test_subghz_frequency_range_433mhz(self, flipper_connection):
-        """Test SubGHz scan at 433.92 MHz (EU remotes)."""
-        msg = FlockProtocol.create_subghz_scan_request(433000000, 435000000)
-        flipper_connection.send(msg)
-        time.sleep(0.5)
-        # Just verify no crash
-
-    def test_subghz_frequency_range_868mhz(self, flipper_connection):
-        """Test SubGHz scan at 868 MHz (EU devices)."""
-        msg = FlockProtocol.create_subghz_scan_request(867000000, 869000000)
-        flipper_connection.send(msg)
-        time.sleep(0.5)
-        # Just verify no crash
-
-    def test_subghz_frequency_range_915mhz(self, flipper_connection):
-        """Test SubGHz scan at 915 MHz (US ISM band)."""
-        msg = FlockProtocol.create_subghz_scan_request(914000000, 916000000)
-        flipper_connection.send(msg)
-        time.sleep(0.5)
-        # Just verify no crash
-
-    def test_subghz_full_band_scan(self, flipper_connection):
-        """Test full band SubGHz scan request."""
-        msg = FlockProtocol.create_subghz_scan_request(300000000, 928000000)
-        flipper_connection.send(msg)
-        time.sleep(0.5)
-        # Just verify no crash
-
-    def test_subghz_detection_count_tracks(self, test_client):
-        """Test that SubGHz detection count is tracked."""
-        status = test_client.get_status()
-        # Detection count should be accessible (may be 0 if no signals)
-        assert status.subghz_detection_count >= 0, "Detection count should be non-negative"
-
     def test_subghz_scan_result_format(self, flipper_connection, test_client):
         """Test SubGHz scan result message format when detections occur."""
         # Request scan
@@ -156,9 +126,8 @@ class TestSubGhzScanner:
         status1 = test_client.get_status()
 
         # Request scan and wait
-        msg = FlockProtocol.create_subghz_scan_request()
-        flipper_connection.send(msg)
-        time.sleep(2.0)
+        flipper_connection.send(_SUBGHZ_SCAN_FRAME)
+        _drain_until_idle(flipper_connection)
 
         # Get status again - scanner should still be ready
         status2 = test_client.get_status()
@@ -176,8 +145,7 @@ class TestSubGhzScanner:
 
         # Verify we can still ping
         time.sleep(0.5)
-        heartbeat = FlockProtocol.create_heartbeat()
-        flipper_connection.send(heartbeat)
+        flipper_connection.send(_HEARTBEAT_FRAME)
         header, _ = flipper_connection.receive(timeout=2.0)
         assert header.msg_type == FlockMessageType.HEARTBEAT
 
@@ -190,17 +158,9 @@ class TestSubGhzScanner:
 class TestBleScanner:
     """Test BLE scanner functionality over USB."""
 
-    def test_ble_ready_status(self, test_client):
-        """Test that BLE scanner reports ready in status."""
-        status = test_client.get_status()
-        # Note: BLE may not always be ready due to Bluetooth Serial usage
-        # This is expected behavior - just verify we get a valid response
-        assert isinstance(status.ble_ready, bool), "BLE ready should be boolean"
-
     def test_ble_scan_request_accepted(self, flipper_connection):
         """Test BLE scan request is accepted without error."""
-        msg = FlockProtocol.create_ble_scan_request()
-        flipper_connection.send(msg)
+        flipper_connection.send(_BLE_SCAN_FRAME)
 
         # Should not receive an error
         try:
@@ -213,15 +173,9 @@ class TestBleScanner:
         except FlipperTimeoutError:
             pass  # No response is acceptable
 
-    def test_ble_scan_count_tracks(self, test_client):
-        """Test that BLE scan count is tracked."""
-        status = test_client.get_status()
-        assert status.ble_scan_count >= 0, "BLE scan count should be non-negative"
-
     def test_ble_scan_result_format(self, flipper_connection):
         """Test BLE scan result message format when devices found."""
-        msg = FlockProtocol.create_ble_scan_request()
-        flipper_connection.send(msg)
+        flipper_connection.send(_BLE_SCAN_FRAME)
 
         # Wait for potential scan result
         try:
@@ -239,24 +193,14 @@ class TestBleScanner:
     def test_ble_multiple_requests(self, flipper_connection):
         """Test multiple rapid BLE scan requests don't crash."""
         for _ in range(3):
-            msg = FlockProtocol.create_ble_scan_request()
-            flipper_connection.send(msg)
-            time.sleep(0.3)
+            flipper_connection.send(_BLE_SCAN_FRAME)
+            _drain_until_idle(flipper_connection, quiet_ms=50)
 
         # Verify we can still ping
-        time.sleep(0.5)
-        heartbeat = FlockProtocol.create_heartbeat()
-        flipper_connection.send(heartbeat)
+        flipper_connection.send(_HEARTBEAT_FRAME)
         header, _ = flipper_connection.receive(timeout=2.0)
         assert header.msg_type == FlockMessageType.HEARTBEAT
 
-    def test_ble_tracker_detection_available(self, test_client):
-        """Test that BLE tracker detection is configured."""
-        # Just verify status is retrievable with BLE info
-        status = test_client.get_status()
-        assert hasattr(status, 'ble_ready'), "Status should have ble_ready field"
-        assert hasattr(status, 'ble_scan_count'), "Status should have ble_scan_count field"
-
 
 # ============================================================================
 # Combined SubGHz + BLE Tests
@@ -266,26 +210,15 @@ class TestBleScanner:
 class TestCombinedScanning:
     """Test combined SubGHz and BLE scanning functionality."""
 
-    def test_both_scanners_report_status(self, test_client):
-        """Test both SubGHz and BLE report in status response."""
-        status = test_client.get_status()
-
-        assert hasattr(status, 'subghz_ready'), "Status should have subghz_ready"
-        assert hasattr(status, 'ble_ready'), "Status should have ble_ready"
-        assert hasattr(status, 'subghz_detection_count'), "Status should have subghz_detection_count"
-        assert hasattr(status, 'ble_scan_count'), "Status should have ble_scan_count"
-
     def test_sequential_subghz_then_ble(self, flipper_connection, test_client):
         """Test SubGHz scan followed by BLE scan."""
         # SubGHz scan
-        msg1 = FlockProtocol.create_subghz_scan_request()
-        flipper_connection.send(msg1)
-        time.sleep(1.0)
+        flipper_connection.send(_SUBGHZ_SCAN_FRAME)
+        _drain_until_idle(flipper_connection)
 
         # BLE scan
-        msg2 = FlockProtocol.create_ble_scan_request()
-        flipper_connection.send(msg2)
-        time.sleep(1.0)
+        flipper_connection.send(_BLE_SCAN_FRAME)
+        _drain_until_idle(flipper_connection)
 
         # Verify system still responsive
         status = test_client.get_status()
@@ -293,23 +226,16 @@ class TestCombinedScanning:
 
     def test_interleaved_scan_requests(self, flipper_connection):
         """Test interleaved SubGHz and BLE scan requests."""
-        for i in range(3):
-            # SubGHz request
-            msg1 = FlockProtocol.create_subghz_scan_request()
-            flipper_connection.send(msg1)
-            time.sleep(0.1)
-
-            # BLE request
-            msg2 = FlockProtocol.create_ble_scan_request()
-            flipper_connection.send(msg2)
-            time.sleep(0.1)
+        # Alternate SubGHz and BLE requests in one write
+        flipper_connection.send_batch([_SUBGHZ_SCAN_FRAME, _BLE_SCAN_FRAME] * 3)
+        _drain_until_idle(flipper_connection)
 
         # Verify we can still ping
-        heartbeat = FlockProtocol.create_heartbeat()
-        flipper_connection.send(heartbeat)
+        flipper_connection.send(_HEARTBEAT_FRAME)
         header, _ = flipper_connection.receive(timeout=2.0)
         assert header.msg_type == FlockMessageType.HEARTBEAT
 
+    @pytest.mark.slow
     def test_detection_counts_accumulate(self, test_client):
         """Test that detection counts accumulate over time."""
         status1 = test_client.get_status()
@@ -323,6 +249,7 @@ class TestCombinedScanning:
         assert status2.subghz_detection_count >= status1.subghz_detection_count
         assert status2.ble_scan_count >= status1.ble_scan_count
 
+    @pytest.mark.slow
     def test_uptime_increases_during_scanning(self, test_client):
         """Test uptime increases while scanning is active."""
         status1 = test_client.get_status()
@@ -346,69 +273,72 @@ class TestScannerStress:
 
     def test_rapid_subghz_requests(self, flipper_connection):
         """Test rapid-fire SubGHz scan requests."""
-        for i in range(10):
-            freq = 300000000 + (i * 50000000)
-            msg = FlockProtocol.create_subghz_scan_request(freq, freq + 10000000)
-            flipper_connection.send(msg)
-            time.sleep(0.05)
+        msgs = [
+            FlockProtocol.create_subghz_scan_request(freq, freq + 10000000)
+            for freq in range(300000000, 800000000, 50000000)
+        ]
+        flipper_connection.send_batch(msgs)
 
         # Clear any pending responses
         time.sleep(0.5)
 
         # Verify connectivity
-        heartbeat = FlockProtocol.create_heartbeat()
-        flipper_connection.send(heartbeat)
+        flipper_connection.send(_HEARTBEAT_FRAME)
         header, _ = flipper_connection.receive(timeout=3.0)
         assert header.msg_type == FlockMessageType.HEARTBEAT
 
     def test_rapid_ble_requests(self, flipper_connection):
         """Test rapid-fire BLE scan requests."""
-        for _ in range(10):
-            msg = FlockProtocol.create_ble_scan_request()
-            flipper_connection.send(msg)
-            time.sleep(0.05)
+        flipper_connection.send_batch([_BLE_SCAN_FRAME] * 10)
 
         # Clear any pending responses
         time.sleep(0.5)
 
         # Verify connectivity
-        heartbeat = FlockProtocol.create_heartbeat()
-        flipper_connection.send(heartbeat)
+        flipper_connection.send(_HEARTBEAT_FRAME)
         header, _ = flipper_connection.receive(timeout=3.0)
         assert header.msg_type == FlockMessageType.HEARTBEAT
 
+    @pytest.mark.slow
     def test_sustained_mixed_scanning(self, flipper_connection, test_client):
         """Test sustained mixed SubGHz and BLE scanning."""
         iterations = 5
 
         for i in range(iterations):
             # SubGHz scan
-            msg1 = FlockProtocol.create_subghz_scan_request()
-            flipper_connection.send(msg1)
+            flipper_connection.send(_SUBGHZ_SCAN_FRAME)
 
-            # Brief pause
-            time.sleep(0.2)
+            # Let the FAP settle
+            _drain_until_idle(flipper_connection)
 
             # BLE scan
-            msg2 = FlockProtocol.create_ble_scan_request()
-            flipper_connection.send(msg2)
+            flipper_connection.send(_BLE_SCAN_FRAME)
 
-            # Brief pause
-            time.sleep(0.2)
+            # Let the FAP settle
+            _drain_until_idle(flipper_connection)
 
         # Verify system health
         status = test_client.get_status()
         assert status.subghz_ready is True, f"SubGHz should be ready after {iterations} iterations"
 
+    @pytest.mark.slow
     def test_long_duration_stability(self, test_client):
         """Test scanner stability over longer duration."""
         start_status = test_client.get_status()
 
-        # Run for a few seconds with periodic checks
-        for _ in range(3):
-            time.sleep(1.0)
-            status = test_client.get_status()
-            assert status.subghz_ready is True, "SubGHz should remain ready"
+        # Run for a few seconds with periodic checks, each status read
+        # overlapping its one-second wait instead of following it
+        async def check_periodically():
+            loop = asyncio.get_running_loop()
+            for _ in range(3):
+                status, _slept = await asyncio.gather(
+                    # run_in_executor rather than to_thread (3.9+); tests support 3.8
+                    loop.run_in_executor(None, test_client.get_status),
+                    asyncio.sleep(1.0),
+                )
+                assert status.subghz_ready is True, "SubGHz should remain ready"
+
+        asyncio.run(check_periodically())
 
         end_status = test_client.get_status()
 
@@ -4,306 +4,482 @@ Sample test data and fixtures for Flock Bridge FAP tests.
 This module provides realistic test data for protocol and communication testing.
 """
 
+import os
 import random
 import struct
-from typing import List, Tuple
+from array import array
+import sys
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flock_protocol import (
+    FlockProtocol, FlockWifiNetwork, FlockSubGhzDetection, FlockBleDevice,
+    FlockNfcDetection, FlockIrDetection, FlockWipsAlert
+)
+
+# ============================================================================
+# Sample Record Types
+# ============================================================================
+
+class SampleWifiNetwork(NamedTuple):
+    ssid: str
+    bssid: bytes
+    rssi: int
+    channel: int
+    security: int
+    hidden: bool
+
+
+class SampleSubGhzDetection(NamedTuple):
+    frequency: int
+    rssi: int
+    modulation: int
+    duration_ms: int
+    bandwidth: int
+    protocol_id: int
+    protocol_name: str
+
+
+class SampleBleDevice(NamedTuple):
+    mac: bytes
+    name: str
+    rssi: int
+    address_type: int
+    connectable: bool
+    manufacturer_id: bytes
+
+
+class SampleNfcCard(NamedTuple):
+    uid: bytes
+    uid_len: int
+    nfc_type: int
+    sak: int
+    atqa: bytes
+    type_name: str
+
+
+class SampleIrSignal(NamedTuple):
+    protocol_id: int
+    protocol_name: str
+    address: int
+    command: int
+    signal_strength: int
+
+
+class SampleWipsAlert(NamedTuple):
+    alert_type: int
+    severity: int
+    ssid: str
+    description: str
+    bssids: Tuple[bytes, ...]
+
 
 # ============================================================================
 # Sample WiFi Networks
 # ============================================================================
 
-SAMPLE_WIFI_NETWORKS = [
-    {
-        "ssid": "HomeNetwork",
-        "bssid": bytes([0xAA, 0xBB, 0xCC, 0x11, 0x22, 0x33]),
-        "rssi": -45,
-        "channel": 1,
-        "security": 3,  # WPA2
-        "hidden": False,
-    },
-    {
-        "ssid": "CoffeeShop_Guest",
-        "bssid": bytes([0x00, 0x1A, 0x2B, 0x3C, 0x4D, 0x5E]),
-        "rssi": -65,
-        "channel": 6,
-        "security": 0,  # Open
-        "hidden": False,
-    },
-    {
-        "ssid": "NETGEAR-5G",
-        "bssid": bytes([0xC0, 0xFF, 0xEE, 0xBA, 0xBE, 0x01]),
-        "rssi": -72,
-        "channel": 36,
-        "security": 4,  # WPA3
-        "hidden": False,
-    },
-    {
-        "ssid": "",  # Hidden network
-        "bssid": bytes([0xDE, 0xAD, 0xBE, 0xEF, 0x00, 0x01]),
-        "rssi": -80,
-        "channel": 11,
-        "security": 3,  # WPA2
-        "hidden": True,
-    },
-]
+SAMPLE_WIFI_NETWORKS = (
+    SampleWifiNetwork(
+        ssid="HomeNetwork",
+        bssid=b"\xaa\xbb\xcc\x11\x22\x33",
+        rssi=-45,
+        channel=1,
+        security=3,  # WPA2
+        hidden=False,
+    ),
+    SampleWifiNetwork(
+        ssid="CoffeeShop_Guest",
+        bssid=b"\x00\x1a\x2b\x3c\x4d\x5e",
+        rssi=-65,
+        channel=6,
+        security=0,  # Open
+        hidden=False,
+    ),
+    SampleWifiNetwork(
+        ssid="NETGEAR-5G",
+        bssid=b"\xc0\xff\xee\xba\xbe\x01",
+        rssi=-72,
+        channel=36,
+        security=4,  # WPA3
+        hidden=False,
+    ),
+    SampleWifiNetwork(
+        ssid="",  # Hidden network
+        bssid=b"\xde\xad\xbe\xef\x00\x01",
+        rssi=-80,
+        channel=11,
+        security=3,  # WPA2
+        hidden=True,
+    ),
+)
 
 # ============================================================================
 # Sample Sub-GHz Detections
 # ============================================================================
 
-SAMPLE_SUBGHZ_DETECTIONS = [
-    {
-        "frequency": 433920000,
-        "rssi": -40,
-        "modulation": 5,  # OOK
-        "duration_ms": 150,
-        "bandwidth": 500000,
-        "protocol_id": 1,
-        "protocol_name": "Princeton",
-    },
-    {
-        "frequency": 315000000,
-        "rssi": -55,
-        "modulation": 3,  # FSK
-        "duration_ms": 200,
-        "bandwidth": 250000,
-        "protocol_id": 5,
-        "protocol_name": "CAME",
-    },
-    {
-        "frequency": 868350000,
-        "rssi": -70,
-        "modulation": 2,  # ASK
-        "duration_ms": 100,
-        "bandwidth": 100000,
-        "protocol_id": 0,
-        "protocol_name": "Unknown",
-    },
-    {
-        "frequency": 915000000,
-        "rssi": -45,
-        "modulation": 6,  # GFSK
-        "duration_ms": 50,
-        "bandwidth": 125000,
-        "protocol_id": 10,
-        "protocol_name": "LoRa",
-    },
-]
+SAMPLE_SUBGHZ_DETECTIONS = (
+    SampleSubGhzDetection(
+        frequency=433920000,
+        rssi=-40,
+        modulation=5,  # OOK
+        duration_ms=150,
+        bandwidth=500000,
+        protocol_id=1,
+        protocol_name="Princeton",
+    ),
+    SampleSubGhzDetection(
+        frequency=315000000,
+        rssi=-55,
+        modulation=3,  # FSK
+        duration_ms=200,
+        bandwidth=250000,
+        protocol_id=5,
+        protocol_name="CAME",
+    ),
+    SampleSubGhzDetection(
+        frequency=868350000,
+        rssi=-70,
+        modulation=2,  # ASK
+        duration_ms=100,
+        bandwidth=100000,
+        protocol_id=0,
+        protocol_name="Unknown",
+    ),
+    SampleSubGhzDetection(
+        frequency=915000000,
+        rssi=-45,
+        modulation=6,  # GFSK
+        duration_ms=50,
+        bandwidth=125000,
+        protocol_id=10,
+        protocol_name="LoRa",
+    ),
+)
 
 # ============================================================================
 # Sample BLE Devices
 # ============================================================================
 
-SAMPLE_BLE_DEVICES = [
-    {
-        "mac": bytes([0x11, 0x22, 0x33, 0x44, 0x55, 0x66]),
-        "name": "iPhone",
-        "rssi": -50,
-        "address_type": 1,  # Random
-        "connectable": False,
-        "manufacturer_id": bytes([0x4C, 0x00]),  # Apple
-    },
-    {
-        "mac": bytes([0xAA, 0xBB, 0xCC, 0xDD, 0xEE, 0xFF]),
-        "name": "AirTag",
-        "rssi": -65,
-        "address_type": 1,
-        "connectable": False,
-        "manufacturer_id": bytes([0x4C, 0x00]),  # Apple
-    },
-    {
-        "mac": bytes([0x00, 0x11, 0x22, 0x33, 0x44, 0x55]),
-        "name": "Tile Mate",
-        "rssi": -75,
-        "address_type": 0,  # Public
-        "connectable": True,
-        "manufacturer_id": bytes([0xAD, 0x01]),  # Tile
-    },
-    {
-        "mac": bytes([0xF0, 0xE1, 0xD2, 0xC3, 0xB4, 0xA5]),
-        "name": "",  # No name
-        "rssi": -85,
-        "address_type": 1,
-        "connectable": False,
-        "manufacturer_id": bytes([0x00, 0x00]),
-    },
-]
+SAMPLE_BLE_DEVICES = (
+    SampleBleDevice(
+        mac=b"\x11\x22\x33\x44\x55\x66",
+        name="iPhone",
+        rssi=-50,
+        address_type=1,  # Random
+        connectable=False,
+        manufacturer_id=b"\x4c\x00",  # Apple
+    ),
+    SampleBleDevice(
+        mac=b"\xaa\xbb\xcc\xdd\xee\xff",
+        name="AirTag",
+        rssi=-65,
+        address_type=1,
+        connectable=False,
+        manufacturer_id=b"\x4c\x00",  # Apple
+    ),
+    SampleBleDevice(
+        mac=b"\x00\x11\x22\x33\x44\x55",
+        name="Tile Mate",
+        rssi=-75,
+        address_type=0,  # Public
+        connectable=True,
+        manufacturer_id=b"\xad\x01",  # Tile
+    ),
+    SampleBleDevice(
+        mac=b"\xf0\xe1\xd2\xc3\xb4\xa5",
+        name="",  # No name
+        rssi=-85,
+        address_type=1,
+        connectable=False,
+        manufacturer_id=b"\x00\x00",
+    ),
+)
 
 # ============================================================================
 # Sample NFC Cards
 # ============================================================================
 
-SAMPLE_NFC_CARDS = [
-    {
-        "uid": bytes([0x04, 0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC]),
-        "uid_len": 7,
-        "nfc_type": 1,  # Type A
-        "sak": 0x08,  # MIFARE Classic 1K
-        "atqa": bytes([0x04, 0x00]),
-        "type_name": "MIFARE Classic 1K",
-    },
-    {
-        "uid": bytes([0x04, 0xAA, 0xBB, 0xCC]),
-        "uid_len": 4,
-        "nfc_type": 1,
-        "sak": 0x00,  # Ultralight
-        "atqa": bytes([0x44, 0x00]),
-        "type_name": "Ultralight",
-    },
-    {
-        "uid": bytes([0x04, 0x11, 0x22, 0x33, 0x44, 0x55, 0x66]),
-        "uid_len": 7,
-        "nfc_type": 1,
-        "sak": 0x20,  # DESFire or payment card
-        "atqa": bytes([0x03, 0x44]),
-        "type_name": "DESFire",
-    },
-]
+SAMPLE_NFC_CARDS = (
+    SampleNfcCard(
+        uid=b"\x04\x12\x34\x56\x78\x9a\xbc",
+        uid_len=7,
+        nfc_type=1,  # Type A
+        sak=0x08,  # MIFARE Classic 1K
+        atqa=b"\x04\x00",
+        type_name="MIFARE Classic 1K",
+    ),
+    SampleNfcCard(
+        uid=b"\x04\xaa\xbb\xcc",
+        uid_len=4,
+        nfc_type=1,
+        sak=0x00,  # Ultralight
+        atqa=b"\x44\x00",
+        type_name="Ultralight",
+    ),
+    SampleNfcCard(
+        uid=b"\x04\x11\x22\x33\x44\x55\x66",
+        uid_len=7,
+        nfc_type=1,
+        sak=0x20,  # DESFire or payment card
+        atqa=b"\x03\x44",
+        type_name="DESFire",
+    ),
+)
 
 # ============================================================================
 # Sample IR Signals
 # ============================================================================
 
-SAMPLE_IR_SIGNALS = [
-    {
-        "protocol_id": 1,
-        "protocol_name": "NEC",
-        "address": 0x04,
-        "command": 0x08,  # Power
-        "signal_strength": -20,
-    },
-    {
-        "protocol_id": 2,
-        "protocol_name": "Samsung",
-        "address": 0x07,
-        "command": 0x02,  # Volume Up
-        "signal_strength": -35,
-    },
-    {
-        "protocol_id": 3,
-        "protocol_name": "Sony",
-        "address": 0x01,
-        "command": 0x15,  # Channel Up
-        "signal_strength": -45,
-    },
-]
+SAMPLE_IR_SIGNALS = (
+    SampleIrSignal(
+        protocol_id=1,
+        protocol_name="NEC",
+        address=0x04,
+        command=0x08,  # Power
+        signal_strength=-20,
+    ),
+    SampleIrSignal(
+        protocol_id=2,
+        protocol_name="Samsung",
+        address=0x07,
+        command=0x02,  # Volume Up
+        signal_strength=-35,
+    ),
+    SampleIrSignal(
+        protocol_id=3,
+        protocol_name="Sony",
+        address=0x01,
+        command=0x15,  # Channel Up
+        signal_strength=-45,
+    ),
+)
 
 # ============================================================================
 # Sample WIPS Alerts
 # ============================================================================
 
-SAMPLE_WIPS_ALERTS = [
-    {
-        "alert_type": 0,  # Evil Twin
-        "severity": 0,  # Critical
-        "ssid": "FreeWiFi",
-        "description": "Potential evil twin AP detected with same SSID",
-        "bssids": [
-            bytes([0xAA, 0xBB, 0xCC, 0x11, 0x22, 0x33]),
-            bytes([0xAA, 0xBB, 0xCC, 0x11, 0x22, 0x34]),
-        ],
-    },
-    {
-        "alert_type": 1,  # Deauth Attack
-        "severity": 1,  # High
-        "ssid": "TargetNetwork",
-        "description": "Deauthentication flood detected",
-        "bssids": [
-            bytes([0xDE, 0xAD, 0xBE, 0xEF, 0x00, 0x01]),
-        ],
-    },
-    {
-        "alert_type": 3,  # Hidden Network Strong
-        "severity": 2,  # Medium
-        "ssid": "",
-        "description": "Strong hidden network detected",
-        "bssids": [
-            bytes([0x00, 0x11, 0x22, 0x33, 0x44, 0x55]),
-        ],
-    },
-]
+SAMPLE_WIPS_ALERTS = (
+    SampleWipsAlert(
+        alert_type=0,  # Evil Twin
+        severity=0,  # Critical
+        ssid="FreeWiFi",
+        description="Potential evil twin AP detected with same SSID",
+        bssids=(
+            b"\xaa\xbb\xcc\x11\x22\x33",
+            b"\xaa\xbb\xcc\x11\x22\x34",
+        ),
+    ),
+    SampleWipsAlert(
+        alert_type=1,  # Deauth Attack
+        severity=1,  # High
+        ssid="TargetNetwork",
+        description="Deauthentication flood detected",
+        bssids=(
+            b"\xde\xad\xbe\xef\x00\x01",
+        ),
+    ),
+    SampleWipsAlert(
+        alert_type=3,  # Hidden Network Strong
+        severity=2,  # Medium
+        ssid="",
+        description="Strong hidden network detected",
+        bssids=(
+            b"\x00\x11\x22\x33\x44\x55",
+        ),
+    ),
+)
+
+# ============================================================================
+# Pre-packed Wire Records
+# ============================================================================
+
+# The samples above encoded once at import time, in the same order
+SAMPLE_WIFI_NETWORKS_WIRE: Tuple[bytes, ...] = tuple(
+    FlockWifiNetwork(**n._asdict()).pack() for n in SAMPLE_WIFI_NETWORKS
+)
+
+SAMPLE_SUBGHZ_DETECTIONS_WIRE: Tuple[bytes, ...] = tuple(
+    FlockSubGhzDetection(**d._asdict()).pack() for d in SAMPLE_SUBGHZ_DETECTIONS
+)
+
+SAMPLE_BLE_DEVICES_WIRE: Tuple[bytes, ...] = tuple(
+    FlockBleDevice(
+        mac_address=d.mac,
+        name=d.name,
+        rssi=d.rssi,
+        address_type=d.address_type,
+        is_connectable=d.connectable,
+        manufacturer_id=d.manufacturer_id,
+    ).pack()
+    for d in SAMPLE_BLE_DEVICES
+)
+
+SAMPLE_NFC_CARDS_WIRE: Tuple[bytes, ...] = tuple(
+    FlockNfcDetection(**c._asdict()).pack() for c in SAMPLE_NFC_CARDS
+)
+
+SAMPLE_IR_SIGNALS_WIRE: Tuple[bytes, ...] = tuple(
+    FlockIrDetection(**s._asdict()).pack() for s in SAMPLE_IR_SIGNALS
+)
+
+SAMPLE_WIPS_ALERTS_WIRE: Tuple[bytes, ...] = tuple(
+    FlockWipsAlert(
+        alert_type=a.alert_type,
+        severity=a.severity,
+        ssid=a.ssid,
+        bssid_count=len(a.bssids),
+        bssids=list(a.bssids),
+        description=a.description,
+    ).pack()
+    for a in SAMPLE_WIPS_ALERTS
+)
+
+# ============================================================================
+# Column Views
+# ============================================================================
+
+# Per-field columns of the samples above for loops that only read one field.
+# MAC/BSSID columns are concatenated with a fixed 6-byte stride.
+WIFI_RSSI = array('b', [n.rssi for n in SAMPLE_WIFI_NETWORKS])
+WIFI_CHANNEL = bytes(n.channel for n in SAMPLE_WIFI_NETWORKS)
+WIFI_BSSID = b"".join(n.bssid for n in SAMPLE_WIFI_NETWORKS)
+
+SUBGHZ_FREQUENCY = array('I', [d.frequency for d in SAMPLE_SUBGHZ_DETECTIONS])
+SUBGHZ_RSSI = array('b', [d.rssi for d in SAMPLE_SUBGHZ_DETECTIONS])
+
+BLE_RSSI = array('b', [d.rssi for d in SAMPLE_BLE_DEVICES])
+BLE_MAC = b"".join(d.mac for d in SAMPLE_BLE_DEVICES)
 
 # ============================================================================
 # Malformed Message Samples
 # ============================================================================
 
-MALFORMED_MESSAGES = [
+MALFORMED_MESSAGES = (
     # Invalid version
-    bytes([0x99, 0x00, 0x00, 0x00]),
+    b"\x99\x00\x00\x00",
 
     # Truncated header
-    bytes([0x01, 0x00]),
+    b"\x01\x00",
 
     # Invalid payload length (larger than buffer)
-    bytes([0x01, 0x00, 0xFF, 0xFF]),
+    b"\x01\x00\xff\xff",
 
     # Valid header but missing payload
-    bytes([0x01, 0x05, 0x10, 0x00]),  # Claims 16 bytes payload
+    b"\x01\x05\x10\x00",  # Claims 16 bytes payload
 
     # All zeros
-    bytes([0x00, 0x00, 0x00, 0x00]),
+    b"\x00\x00\x00\x00",
 
     # All ones
-    bytes([0xFF, 0xFF, 0xFF, 0xFF]),
-]
+    b"\xff\xff\xff\xff",
+)
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
-def generate_random_mac() -> bytes:
+def _random_bytes(rng: random.Random, n: int) -> bytes:
+    """Draw n random bytes (Random.randbytes is 3.9+; tests support 3.8)."""
+    if n <= 0:
+        return b""
+    return rng.getrandbits(8 * n).to_bytes(n, 'little')
+
+
+def generate_random_mac(rng: random.Random = random) -> bytes:
     """Generate a random MAC address."""
-    return bytes([random.randint(0, 255) for _ in range(6)])
+    return _random_bytes(rng, 6)
+
+
+_SSID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
 
 
-def generate_random_ssid(max_len: int = 32) -> str:
+def generate_random_ssid(max_len: int = 32, rng: random.Random = random) -> str:
     """Generate a random SSID."""
-    length = random.randint(1, max_len)
-    chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
-    return "".join(random.choice(chars) for _ in range(length))
+    length = rng.randint(1, max_len)
+    return "".join(rng.choices(_SSID_CHARS, k=length))
 
 
-def generate_random_uid(length: int = 7) -> bytes:
+def generate_random_uid(length: int = 7, rng: random.Random = random) -> bytes:
     """Generate a random NFC UID."""
-    return bytes([random.randint(0, 255) for _ in range(length)])
+    return _random_bytes(rng, length)
 
 
-def generate_random_frequency(band: str = "433") -> int:
+_FREQUENCY_BANDS = {
+    "315": (310000000, 320000000),
+    "433": (433050000, 434790000),
+    "868": (863000000, 870000000),
+    "915": (902000000, 928000000),
+}
+
+
+def generate_random_frequency(band: str = "433", rng: random.Random = random) -> int:
     """Generate a random frequency for a given band."""
-    bands = {
-        "315": (310000000, 320000000),
-        "433": (433050000, 434790000),
-        "868": (863000000, 870000000),
-        "915": (902000000, 928000000),
-    }
-    low, high = bands.get(band, bands["433"])
-    return random.randint(low, high)
-
-
-def create_stress_test_messages(count: int = 100) -> List[bytes]:
-    """Create a list of random valid messages for stress testing."""
-    import sys
-    sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
-    from flock_protocol import FlockProtocol, FlockMessageType
-
-    messages = []
-    message_creators = [
-        FlockProtocol.create_heartbeat,
-        FlockProtocol.create_status_request,
-        FlockProtocol.create_wifi_scan_request,
-        FlockProtocol.create_ble_scan_request,
-        FlockProtocol.create_ir_scan_request,
-        FlockProtocol.create_nfc_scan_request,
-        lambda: FlockProtocol.create_subghz_scan_request(
-            generate_random_frequency(),
-            generate_random_frequency()
-        ),
-        lambda: FlockProtocol.create_lf_probe(random.randint(100, 5000)),
-        lambda: FlockProtocol.create_wifi_probe(generate_random_ssid()),
-    ]
+    low, high = _FREQUENCY_BANDS.get(band, _FREQUENCY_BANDS["433"])
+    return rng.randint(low, high)
+
+
+def _create_random_subghz_scan_request(rng: random.Random = random) -> bytes:
+    return FlockProtocol.create_subghz_scan_request(
+        generate_random_frequency(rng=rng),
+        generate_random_frequency(rng=rng)
+    )
+
 
-    for _ in range(count):
-        creator = random.choice(message_creators)
-        messages.append(creator())
+def _create_random_lf_probe(rng: random.Random = random) -> bytes:
+    return FlockProtocol.create_lf_probe(rng.randint(100, 5000))
+
+
+def _create_random_wifi_probe(rng: random.Random = random) -> bytes:
+    return FlockProtocol.create_wifi_probe(generate_random_ssid(rng=rng))
+
+
+_MESSAGE_CREATORS = (
+    FlockProtocol.create_heartbeat,
+    FlockProtocol.create_status_request,
+    FlockProtocol.create_wifi_scan_request,
+    FlockProtocol.create_ble_scan_request,
+    FlockProtocol.create_ir_scan_request,
+    FlockProtocol.create_nfc_scan_request,
+    _create_random_subghz_scan_request,
+    _create_random_lf_probe,
+    _create_random_wifi_probe,
+)
+
+# Creators above that draw random fields and take the generator's rng
+_RANDOMIZED_CREATORS = (
+    _create_random_subghz_scan_request,
+    _create_random_lf_probe,
+    _create_random_wifi_probe,
+)
+
+DEFAULT_STRESS_SEED = 0xF10CC
+
+
+def stress_test_seed() -> int:
+    """
+    Seed for the stress-test generators.
+
+    Uses FLOCK_STRESS_SEED (default DEFAULT_STRESS_SEED) offset by the
+    pytest-xdist worker index, so each worker gets a distinct but
+    reproducible corpus.
+    """
+    base = int(os.environ.get("FLOCK_STRESS_SEED", str(DEFAULT_STRESS_SEED)), 0)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return base + int(worker[2:])
+
+
+def create_stress_test_messages(count: int = 100, seed: Optional[int] = None) -> List[bytes]:
+    """
+    Create a list of random valid messages for stress testing.
+
+    Draws from a private random.Random seeded with seed (stress_test_seed()
+    when None), so the same seed always yields the same messages.
+    """
+    rng = random.Random(stress_test_seed() if seed is None else seed)
+    return [
+        creator(rng) if creator in _RANDOMIZED_CREATORS else creator()
+        for creator in rng.choices(_MESSAGE_CREATORS, k=count)
+    ]
 
-    return messages
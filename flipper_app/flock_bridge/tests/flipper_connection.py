@@ -5,30 +5,44 @@ This module provides a reliable connection to the Flipper Zero over USB CDC,
 handling message framing, timeouts, and reconnection.
 """
 
+import asyncio
 import serial
 import serial.tools.list_ports
+import os
+import selectors
+import struct
 import time
 import threading
-import queue
 import logging
-from typing import Optional, Tuple, List, Callable
+from collections import deque
+from typing import Optional, Tuple, List, Callable, Union
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
 
 try:
     from .flock_protocol import (
         FlockProtocol, FlockMessageHeader, FlockMessageBuffer,
         FlockMessageType, FlockErrorCode, FlockStatusResponse,
-        FLOCK_HEADER_SIZE, FLOCK_MAX_MESSAGE_SIZE
+        FLOCK_HEADER_SIZE, FLOCK_HEADER_STRUCT, FLOCK_MAX_MESSAGE_SIZE,
+        FLOCK_PROTOCOL_VERSION
     )
 except ImportError:
     from flock_protocol import (
         FlockProtocol, FlockMessageHeader, FlockMessageBuffer,
         FlockMessageType, FlockErrorCode, FlockStatusResponse,
-        FLOCK_HEADER_SIZE, FLOCK_MAX_MESSAGE_SIZE
+        FLOCK_HEADER_SIZE, FLOCK_HEADER_STRUCT, FLOCK_MAX_MESSAGE_SIZE,
+        FLOCK_PROTOCOL_VERSION
     )
 
+try:
+    import serial_asyncio
+except ImportError:  # Optional: only used by AsyncFlipperConnection
+    serial_asyncio = None
+
 logger = logging.getLogger(__name__)
 
+_MSG_TYPE_ERROR = int(FlockMessageType.ERROR)
+
 
 class FlipperConnectionError(Exception):
     """Raised when connection to Flipper fails."""
@@ -40,6 +54,17 @@ class FlipperTimeoutError(Exception):
     pass
 
 
+def _error_response_exception(payload: bytes) -> FlipperConnectionError:
+    """Build the exception an ERROR response raises in the request it fails."""
+    # Parsed before any future is touched: a malformed payload must still
+    # complete the request rather than escape into the receive path
+    try:
+        error_code, error_msg = FlockProtocol.parse_error(payload)
+    except ValueError as e:
+        return FlipperConnectionError(f"Malformed error response: {e}")
+    return FlipperConnectionError(f"Error response: {error_code.name}: {error_msg}")
+
+
 class FlipperConnection:
     """
     USB CDC connection to Flipper Zero running Flock Bridge FAP.
@@ -59,6 +84,28 @@ class FlipperConnection:
     FLIPPER_VID_ALT = 0x1209
     FLIPPER_PID_ALT = 0x7776
 
+    # Linux serial_struct layout used by TIOCGSERIAL/TIOCSSERIAL
+    SERIAL_STRUCT_SIZE = 72
+    SERIAL_STRUCT_FLAGS_OFFSET = 16
+    ASYNC_LOW_LATENCY = 0x2000
+
+    # Serial read timeout for the rx thread; bounds how long it takes to
+    # notice a stop request while the port is idle
+    RX_READ_TIMEOUT = 0.1
+
+    # Largest single read the rx thread issues on the raw fd
+    RX_CHUNK_SIZE = 65536
+
+    # Driver-side RX/TX queue size requested where pyserial supports it
+    # (Windows), so the CDC driver can aggregate 64-byte packets
+    DRIVER_BUFFER_SIZE = 65536
+
+    # How long connect() waits for the heartbeat that confirms stream sync
+    SYNC_TIMEOUT = 1.0
+
+    # How long flush_input() waits for the rx thread to carry out the flush
+    FLUSH_TIMEOUT = 2.0
+
     def __init__(
         self,
         port: Optional[str] = None,
@@ -83,12 +130,30 @@ class FlipperConnection:
         self._serial: Optional[serial.Serial] = None
         self._running = False
         self._rx_thread: Optional[threading.Thread] = None
-        self._rx_queue: queue.Queue = queue.Queue()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        # Single producer (rx thread) / single consumer; the event only
+        # signals that the deque may have become non-empty
+        self._rx_queue: deque = deque()
+        self._rx_event = threading.Event()
+
+        # Messages waiting for callback dispatch, handed from the rx thread
+        # to the dispatch thread so user code never stalls serial reads
+        self._dispatch_queue: deque = deque()
+        self._dispatch_event = threading.Event()
+
+        # send_async requests awaiting a response, oldest first
+        self._pending_responses: List[Tuple[Optional[int], Future]] = []
+        self._pending_lock = threading.Lock()
         self._message_buffer = FlockMessageBuffer()
+        # flush_input requests for the rx thread, which alone touches the
+        # message buffer while it runs; each Event is set once flushed
+        self._flush_waiters: deque = deque()
         self._lock = threading.RLock()
+        self._write_lock = threading.Lock()  # Keeps concurrent frames whole on the wire
 
-        # Callbacks for received messages
-        self._message_callbacks: List[Callable[[FlockMessageHeader, bytes], None]] = []
+        # Callbacks for received messages; replaced (never mutated) so the
+        # rx thread can iterate its snapshot without taking the lock
+        self._message_callbacks: Tuple[Callable[[FlockMessageHeader, bytes], None], ...] = ()
 
     @classmethod
     def find_flipper_port(cls) -> Optional[str]:
@@ -129,7 +194,6 @@ class FlipperConnection:
             return flipper_ports[0]
 
         # Multiple ports - test each for protocol response
-        import struct
         for port_name in reversed(flipper_ports):  # Try highest first (likely protocol port)
             try:
                 logger.info(f"Testing port {port_name} for Flock protocol...")
@@ -138,7 +202,7 @@ class FlipperConnection:
                 test_ser.reset_input_buffer()
 
                 # Send heartbeat
-                heartbeat = struct.pack('<BBH', 1, 0, 0)  # version=1, type=0, length=0
+                heartbeat = FLOCK_HEADER_STRUCT.pack(1, 0, 0)  # version=1, type=0, length=0
                 test_ser.write(heartbeat)
                 time.sleep(0.3)
 
@@ -146,7 +210,7 @@ class FlipperConnection:
                 test_ser.close()
 
                 if len(response) >= 4:
-                    version, msg_type, length = struct.unpack('<BBH', response[:4])
+                    version, msg_type, length = FLOCK_HEADER_STRUCT.unpack_from(response)
                     if version == 1 and msg_type == 0:
                         logger.info(f"Found Flock protocol port: {port_name}")
                         return port_name
@@ -188,31 +252,69 @@ class FlipperConnection:
                 self._serial = serial.Serial(
                     port=port,
                     baudrate=self.baudrate,
-                    timeout=self.timeout,
+                    timeout=self.RX_READ_TIMEOUT,
                     write_timeout=self.timeout,
                     dsrdtr=False,  # Don't use hardware flow control
                     rtscts=False,
                 )
+                if hasattr(self._serial, "set_buffer_size"):
+                    self._serial.set_buffer_size(
+                        rx_size=self.DRIVER_BUFFER_SIZE,
+                        tx_size=self.DRIVER_BUFFER_SIZE,
+                    )
                 # Explicitly set DTR and RTS to signal connection
                 self._serial.dtr = True
                 self._serial.rts = True
                 time.sleep(0.2)  # Give the FAP time to recognize the connection
-
-                self._serial.reset_input_buffer()
-                self._serial.reset_output_buffer()
                 logger.info(f"Connected to Flipper Zero at {port} (DTR=True, RTS=True)")
 
                 # Start receive thread
                 self._running = True
                 self._rx_thread = threading.Thread(target=self._rx_loop, daemon=True)
                 self._rx_thread.start()
-
-                return True
+                if not (self._dispatch_thread and self._dispatch_thread.is_alive()):
+                    self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+                    self._dispatch_thread.start()
 
             except serial.SerialException as e:
                 logger.error(f"Failed to connect to {port}: {e}")
                 raise FlipperConnectionError(f"Failed to connect: {e}")
 
+        self._sync_stream()
+        return True
+
+    def _sync_stream(self) -> None:
+        """
+        Resynchronize with the FAP using a heartbeat instead of resetting buffers.
+
+        reset_input_buffer/reset_output_buffer are control transfers on some
+        VCP drivers and cost tens of ms per open. A heartbeat reply means the
+        parser is aligned, so the buffers are only flushed when the sync
+        fails: a stale tail that looks like a valid header would otherwise
+        hold the parser waiting for a payload that never arrives.
+        """
+        try:
+            future = self.send_async(
+                FlockMessageType.HEARTBEAT,
+                expected_type=FlockMessageType.HEARTBEAT,
+            )
+            future.result(timeout=self.SYNC_TIMEOUT)
+        except FutureTimeoutError:
+            # Cancel so the stale request can't swallow a later heartbeat
+            future.cancel()
+            logger.warning("No heartbeat from Flipper during connect sync")
+        except FlipperConnectionError as e:
+            logger.warning(f"Connect sync failed: {e}")
+        else:
+            # Anything parsed so far belongs to the previous session
+            self.clear_rx_queue()
+            return
+
+        try:
+            self.flush_input()
+        except (FlipperConnectionError, FlipperTimeoutError) as e:
+            logger.warning(f"Flush after failed connect sync failed: {e}")
+
     def disconnect(self) -> None:
         """Disconnect from the Flipper Zero."""
         with self._lock:
@@ -222,6 +324,12 @@ class FlipperConnection:
                 self._rx_thread.join(timeout=2.0)
                 self._rx_thread = None
 
+            if self._dispatch_thread:
+                self._dispatch_event.set()
+                self._dispatch_thread.join(timeout=2.0)
+                self._dispatch_thread = None
+            self._dispatch_queue.clear()
+
             if self._serial:
                 try:
                     self._serial.close()
@@ -230,8 +338,44 @@ class FlipperConnection:
                 self._serial = None
 
             self._message_buffer.clear()
+            self._fail_pending("Disconnected")
             logger.info("Disconnected from Flipper Zero")
 
+    def enable_low_latency(self) -> bool:
+        """
+        Set ASYNC_LOW_LATENCY on the tty so received bytes are not batched.
+
+        Only supported on Linux; other platforms (and drivers that reject
+        TIOCSSERIAL) are left untouched.
+
+        Returns:
+            True if low-latency mode was enabled.
+        """
+        try:
+            import fcntl
+            import termios
+            get_serial, set_serial = termios.TIOCGSERIAL, termios.TIOCSSERIAL
+        except (ImportError, AttributeError):
+            return False
+
+        with self._lock:
+            if not self._serial or not self._serial.is_open:
+                raise FlipperConnectionError("Not connected")
+
+            try:
+                fd = self._serial.fileno()
+                info = bytearray(fcntl.ioctl(fd, get_serial, bytes(self.SERIAL_STRUCT_SIZE)))
+                flags, = struct.unpack_from('i', info, self.SERIAL_STRUCT_FLAGS_OFFSET)
+                struct.pack_into('i', info, self.SERIAL_STRUCT_FLAGS_OFFSET,
+                                 flags | self.ASYNC_LOW_LATENCY)
+                fcntl.ioctl(fd, set_serial, bytes(info))
+            except (OSError, serial.SerialException) as e:
+                logger.debug(f"Low-latency mode not available: {e}")
+                return False
+
+            logger.info("Enabled low-latency mode on serial port")
+            return True
+
     def is_connected(self) -> bool:
         """Check if currently connected."""
         with self._lock:
@@ -247,20 +391,38 @@ class FlipperConnection:
         Returns:
             True if send successful.
         """
+        # The connection lock only guards the handle; the write itself is
+        # serialized by the cheaper, non-reentrant write lock
         with self._lock:
-            if not self._serial or not self._serial.is_open:
+            ser = self._serial
+            if not ser or not ser.is_open:
                 raise FlipperConnectionError("Not connected")
 
-            try:
-                self._serial.write(data)
-                self._serial.flush()
-                logger.debug(f"Sent {len(data)} bytes: {data.hex()}")
-                return True
-            except serial.SerialException as e:
-                logger.error(f"Send failed: {e}")
-                if self.auto_reconnect:
-                    self._handle_disconnect()
-                raise FlipperConnectionError(f"Send failed: {e}")
+        try:
+            with self._write_lock:
+                # No flush(): it only waits for the OS to drain the write
+                # (tcdrain / FlushFileBuffers) and adds a round-trip per send
+                ser.write(data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent %d bytes: %s", len(data), data.hex())
+            return True
+        except serial.SerialException as e:
+            logger.error(f"Send failed: {e}")
+            if self.auto_reconnect:
+                self._handle_disconnect()
+            raise FlipperConnectionError(f"Send failed: {e}")
+
+    def send_batch(self, messages: List[bytes]) -> bool:
+        """
+        Send several pre-built messages (or message parts) as a single write.
+
+        Args:
+            messages: Protocol messages, or header/payload parts, in wire order
+
+        Returns:
+            True if send successful.
+        """
+        return self.send(b''.join(messages))
 
     def send_message(self, msg_type: FlockMessageType, payload: bytes = b'') -> bool:
         """
@@ -287,10 +449,161 @@ class FlipperConnection:
             Tuple of (header, payload) or None if timeout.
         """
         timeout = timeout if timeout is not None else self.timeout
+        return self._pop_message(timeout)
+
+    def receive_n(self, n: int, timeout: Optional[float] = None) -> List[Tuple[FlockMessageHeader, bytes]]:
+        """
+        Receive up to n messages, sharing a single deadline across all of them.
+
+        Args:
+            n: Number of messages to wait for
+            timeout: Total time budget in seconds (None = use default)
+
+        Returns:
+            List of (header, payload) tuples; shorter than n on timeout.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        deadline = time.monotonic() + timeout
+        messages = []
+        while len(messages) < n:
+            result = self._pop_message_until(deadline)
+            if result is None:
+                break
+            messages.append(result)
+        return messages
+
+    def receive_all(
+        self,
+        duration: float,
+        idle_timeout: Optional[float] = None
+    ) -> List[Tuple[FlockMessageHeader, bytes]]:
+        """
+        Receive every message that arrives within a time window.
+
+        Args:
+            duration: Maximum time to collect for, in seconds
+            idle_timeout: Stop early once no message has arrived for this long
+                (None = always collect for the full duration)
+
+        Returns:
+            List of (header, payload) tuples in arrival order.
+        """
+        deadline = time.monotonic() + duration
+        messages = []
+        while True:
+            if idle_timeout is None:
+                until = deadline
+            else:
+                until = min(deadline, time.monotonic() + idle_timeout)
+            result = self._pop_message_until(until)
+            if result is None:
+                break
+            messages.append(result)
+        return messages
+
+    def clear_rx_queue(self) -> None:
+        """Discard any received messages that have not been consumed yet."""
+        self._rx_queue.clear()
+
+    def _pop_message(self, timeout: float) -> Optional[Tuple[FlockMessageHeader, bytes]]:
+        """Pop the oldest received message, waiting up to timeout for one to arrive."""
         try:
-            return self._rx_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+            return self._rx_queue.popleft()
+        except IndexError:
+            pass
+        return self._pop_message_until(time.monotonic() + timeout)
+
+    def _pop_message_until(self, deadline: float) -> Optional[Tuple[FlockMessageHeader, bytes]]:
+        """Pop the oldest received message, waiting until a time.monotonic() deadline."""
+        # Read the clock only when the queue is empty and we have to wait
+        while True:
+            try:
+                return self._rx_queue.popleft()
+            except IndexError:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._rx_event.wait(remaining):
+                return None
+            self._rx_event.clear()
+
+    def flush_input(self) -> None:
+        """
+        Discard all unread input: OS serial buffer, partial frames and queued messages.
+
+        The flush is carried out by the rx thread between reads, so it never
+        races a parse in progress and also drops bytes already read but not
+        yet parsed.
+
+        Raises:
+            FlipperConnectionError: If not connected.
+            FlipperTimeoutError: If the rx thread does not flush in time.
+        """
+        with self._lock:
+            if not self._serial or not self._serial.is_open:
+                raise FlipperConnectionError("Not connected")
+            rx_thread = self._rx_thread
+            if rx_thread is None or not rx_thread.is_alive():
+                self._flush_rx()
+                return
+
+        done = threading.Event()
+        self._flush_waiters.append(done)
+        if not done.wait(self.FLUSH_TIMEOUT):
+            raise FlipperTimeoutError(f"Input not flushed within {self.FLUSH_TIMEOUT}s")
+
+    def _flush_rx(self) -> None:
+        """Flush all unread input and release the flush_input calls it covers."""
+        # Snapshot first: a request arriving mid-flush waits for the next one
+        waiters = []
+        while self._flush_waiters:
+            waiters.append(self._flush_waiters.popleft())
+
+        try:
+            serial_port = self._serial
+            if serial_port is not None and serial_port.is_open:
+                serial_port.reset_input_buffer()
+            self._message_buffer.clear()
+            self.clear_rx_queue()
+        finally:
+            for done in waiters:
+                done.set()
+
+    def send_async(
+        self,
+        msg_type: FlockMessageType,
+        payload: bytes = b'',
+        expected_type: Optional[FlockMessageType] = None
+    ) -> Future:
+        """
+        Send a message and return a future for its response.
+
+        The protocol carries no request ids, so outstanding requests are
+        matched in send order: each incoming message resolves the oldest
+        pending request whose expected_type it satisfies. An ERROR response
+        fails the oldest pending request. Messages that match no pending
+        request go to the normal receive queue.
+
+        Args:
+            msg_type: Message type to send
+            payload: Message payload
+            expected_type: Expected response type (None = accept any)
+
+        Returns:
+            Future resolving to (header, payload), or raising
+            FlipperConnectionError on an error response or disconnect.
+        """
+        future: Future = Future()
+        # Match on plain ints; headers from the stream parser carry raw ints
+        entry = (None if expected_type is None else int(expected_type), future)
+        with self._pending_lock:
+            self._pending_responses.append(entry)
+        try:
+            self.send_message(msg_type, payload)
+        except Exception:
+            with self._pending_lock:
+                self._pending_responses.remove(entry)
+            raise
+        return future
 
     def send_and_receive(
         self,
@@ -315,88 +628,194 @@ class FlipperConnection:
             FlipperTimeoutError: If no response received within timeout.
         """
         # Clear any pending messages
-        while not self._rx_queue.empty():
-            try:
-                self._rx_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.clear_rx_queue()
 
-        # Send message
-        self.send_message(msg_type, payload)
-
-        # Wait for response
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            remaining = timeout - (time.time() - start_time)
-            result = self.receive(timeout=min(remaining, 0.5))
-            if result:
-                header, response_payload = result
-                if expected_type is None or header.msg_type == expected_type:
-                    return result
-                # Handle error responses
-                if header.msg_type == FlockMessageType.ERROR:
-                    error_code, error_msg = FlockProtocol.parse_error(response_payload)
-                    raise FlipperConnectionError(f"Error response: {error_code.name}: {error_msg}")
-                # Keep waiting for expected type
-                logger.debug(f"Ignoring unexpected message type: {header.msg_type}")
-
-        raise FlipperTimeoutError(f"No response received within {timeout}s")
+        future = self.send_async(msg_type, payload, expected_type)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise FlipperTimeoutError(f"No response received within {timeout}s")
+
+    def _resolve_pending(self, header: FlockMessageHeader, payload: bytes) -> bool:
+        """Complete the pending request this message answers; False if none."""
+        msg_type = header.msg_type
+        with self._pending_lock:
+            pending = self._pending_responses
+            # Requests that timed out were cancelled by their waiter
+            pending[:] = [entry for entry in pending if not entry[1].cancelled()]
+
+            for i, (expected_type, future) in enumerate(pending):
+                if expected_type is None or msg_type == expected_type:
+                    del pending[i]
+                    if future.set_running_or_notify_cancel():
+                        future.set_result((header, payload))
+                        return True
+                    return False
+
+            if msg_type == _MSG_TYPE_ERROR and pending:
+                _, future = pending.pop(0)
+                error = _error_response_exception(payload)
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(error)
+                    return True
+
+        return False
+
+    def _fail_pending(self, reason: str) -> None:
+        """Fail every outstanding send_async request."""
+        with self._pending_lock:
+            pending, self._pending_responses = self._pending_responses, []
+        for _, future in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(FlipperConnectionError(reason))
 
     def add_message_callback(
         self,
         callback: Callable[[FlockMessageHeader, bytes], None]
     ) -> None:
         """Add a callback for received messages."""
-        self._message_callbacks.append(callback)
+        with self._lock:
+            self._message_callbacks = self._message_callbacks + (callback,)
 
     def remove_message_callback(
         self,
         callback: Callable[[FlockMessageHeader, bytes], None]
     ) -> None:
         """Remove a message callback."""
-        try:
-            self._message_callbacks.remove(callback)
-        except ValueError:
-            pass
+        with self._lock:
+            callbacks = list(self._message_callbacks)
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                return
+            self._message_callbacks = tuple(callbacks)
 
     def _rx_loop(self) -> None:
         """Background thread for receiving data."""
-        while self._running:
-            try:
-                if not self._serial or not self._serial.is_open:
+        selector, fd = self._open_rx_selector()
+        # Reused for every raw fd read; only the parsed payloads are copied
+        rx_view = memoryview(bytearray(self.RX_CHUNK_SIZE)) if selector is not None else None
+        try:
+            while self._running:
+                try:
+                    if not self._serial or not self._serial.is_open:
+                        time.sleep(0.1)
+                        continue
+
+                    data = self._read_available(selector, fd, rx_view)
+                    if self._flush_waiters:
+                        # Whatever was just read predates the flush too
+                        self._flush_rx()
+                        continue
+                    if not data:
+                        continue
+
+                    # Keep hex dumps and formatting off the hot path unless asked for
+                    debug = logger.isEnabledFor(logging.DEBUG)
+                    if debug:
+                        logger.debug("Received %d bytes: %s", len(data), data.hex())
+                    self._message_buffer.append(data)
+
+                    # Extract complete messages
+                    messages = self._message_buffer.get_messages()
+                    if not messages:
+                        continue
+
+                    rx_append = self._rx_queue.append
+                    for header, payload in messages:
+                        if debug:
+                            logger.debug("Parsed message: type=%s, len=%d",
+                                         header.msg_type, header.payload_length)
+                        if self._pending_responses and self._resolve_pending(header, payload):
+                            continue
+                        rx_append((header, payload))
+                    self._rx_event.set()
+
+                    # Hand off to the dispatch thread for callbacks
+                    if self._message_callbacks:
+                        self._dispatch_queue.extend(messages)
+                        self._dispatch_event.set()
+
+                except serial.SerialException as e:
+                    logger.error(f"Receive error: {e}")
+                    if self.auto_reconnect:
+                        self._handle_disconnect()
+                    break
+                except Exception as e:
+                    logger.error(f"RX loop error: {e}")
                     time.sleep(0.1)
-                    continue
-
-                # Read available data
-                if self._serial.in_waiting > 0:
-                    data = self._serial.read(self._serial.in_waiting)
-                    if data:
-                        logger.debug(f"Received {len(data)} bytes: {data.hex()}")
-                        self._message_buffer.append(data)
-
-                        # Extract complete messages
-                        messages = self._message_buffer.get_messages()
-                        for header, payload in messages:
-                            logger.debug(f"Parsed message: type={header.msg_type}, len={header.payload_length}")
-                            self._rx_queue.put((header, payload))
-
-                            # Notify callbacks
-                            for callback in self._message_callbacks:
-                                try:
-                                    callback(header, payload)
-                                except Exception as e:
-                                    logger.error(f"Callback error: {e}")
-                else:
-                    time.sleep(0.01)
+        finally:
+            if selector is not None:
+                selector.close()
+            # Don't strand flush_input callers once the rx thread is gone
+            if self._flush_waiters:
+                try:
+                    self._flush_rx()
+                except (serial.SerialException, OSError):
+                    pass
 
-            except serial.SerialException as e:
-                logger.error(f"Receive error: {e}")
-                if self.auto_reconnect:
-                    self._handle_disconnect()
-                break
-            except Exception as e:
-                logger.error(f"RX loop error: {e}")
-                time.sleep(0.1)
+    def _open_rx_selector(self) -> Tuple[Optional[selectors.BaseSelector], Optional[int]]:
+        """Register the port's fd for read readiness (POSIX only)."""
+        try:
+            fd = self._serial.fileno()
+        except (AttributeError, serial.SerialException, OSError):
+            # Windows (and URL-style) ports have no selectable fd
+            return None, None
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+        return selector, fd
+
+    def _read_available(
+        self,
+        selector: Optional[selectors.BaseSelector],
+        fd: Optional[int],
+        rx_view: Optional[memoryview]
+    ) -> Union[bytes, memoryview]:
+        """
+        Wait up to RX_READ_TIMEOUT for data and return everything available.
+
+        On the selector path the result is a view into rx_view, valid only
+        until the next read.
+        """
+        if selector is None:
+            # Block in the driver for the first byte, then take the rest of
+            # the burst in the same pass
+            data = self._serial.read(1)
+            if data:
+                waiting = self._serial.in_waiting
+                if waiting:
+                    data += self._serial.read(waiting)
+            return data
+
+        if not selector.select(self.RX_READ_TIMEOUT):
+            return b''
+        try:
+            n = os.readv(fd, [rx_view])
+        except BlockingIOError:
+            return b''
+        except OSError as e:
+            raise serial.SerialException(f"read failed: {e}")
+        if not n:
+            # Readable but empty: the device went away
+            raise serial.SerialException("device reports readiness to read but returned no data")
+        return rx_view[:n]
+
+    def _dispatch_loop(self) -> None:
+        """Background thread for running message callbacks."""
+        while self._running:
+            if not self._dispatch_event.wait(0.1):
+                continue
+            self._dispatch_event.clear()
+
+            while self._dispatch_queue:
+                header, payload = self._dispatch_queue.popleft()
+                # Snapshot; see add_message_callback
+                for callback in self._message_callbacks:
+                    try:
+                        callback(header, payload)
+                    except Exception as e:
+                        logger.error(f"Callback error: {e}")
 
     def _handle_disconnect(self) -> None:
         """Handle unexpected disconnection."""
@@ -408,6 +827,7 @@ class FlipperConnection:
                     pass
                 self._serial = None
             logger.warning("Connection lost")
+        self._fail_pending("Connection lost")
 
     @contextmanager
     def session(self):
@@ -531,7 +951,7 @@ class FlipperTestClient:
                 payload[FLOCK_HEADER_SIZE:],
                 timeout=timeout
             )
-            if header.msg_type == FlockMessageType.ERROR:
+            if header.msg_type == _MSG_TYPE_ERROR:
                 error_code, msg = FlockProtocol.parse_error(response)
                 return (False, f"{error_code.name}: {msg}")
             return (True, "OK")
@@ -558,7 +978,7 @@ class FlipperTestClient:
                 payload[FLOCK_HEADER_SIZE:],
                 timeout=timeout
             )
-            if header.msg_type == FlockMessageType.ERROR:
+            if header.msg_type == _MSG_TYPE_ERROR:
                 error_code, msg = FlockProtocol.parse_error(response)
                 return (False, f"{error_code.name}: {msg}")
             return (True, "OK")
@@ -582,10 +1002,9 @@ class FlipperTestClient:
             size: Payload size to send (should trigger error if > FLOCK_MAX_PAYLOAD_SIZE)
         """
         # Manually construct header with oversized payload_length
-        import struct
-        header = struct.pack('<BBH', 1, FlockMessageType.HEARTBEAT, size)
+        header = FLOCK_HEADER_STRUCT.pack(FLOCK_PROTOCOL_VERSION, FlockMessageType.HEARTBEAT, size)
         fake_payload = b'\x00' * min(size, 100)  # Only send partial payload
-        self.connection.send(header + fake_payload)
+        self.connection.send_batch([header, fake_payload])
         return self.connection.receive(timeout=2.0)
 
     def collect_messages(self, duration: float = 5.0) -> List[Tuple[FlockMessageHeader, bytes]]:
@@ -598,13 +1017,7 @@ class FlipperTestClient:
         Returns:
             List of (header, payload) tuples.
         """
-        messages = []
-        start = time.time()
-        while time.time() - start < duration:
-            msg = self.connection.receive(timeout=0.5)
-            if msg:
-                messages.append(msg)
-        return messages
+        return self.connection.receive_all(duration)
 
     @contextmanager
     def session(self):
@@ -614,3 +1027,218 @@ class FlipperTestClient:
             yield self
         finally:
             self.disconnect()
+
+
+class _FlockSerialProtocol(asyncio.Protocol):
+    """asyncio protocol feeding serial data into an AsyncFlipperConnection."""
+
+    def __init__(self, connection: 'AsyncFlipperConnection'):
+        self._connection = connection
+
+    def data_received(self, data: bytes) -> None:
+        self._connection._on_data(data)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._connection._on_connection_lost(exc)
+
+
+class AsyncFlipperConnection:
+    """
+    asyncio USB CDC connection to Flipper Zero running Flock Bridge FAP.
+
+    Counterpart of FlipperConnection for fanning out over several devices:
+    every connection is driven by the running event loop rather than its own
+    rx thread. Requires pyserial-asyncio.
+
+    Example:
+        clients = [AsyncFlipperConnection(port) for port in ports]
+        await asyncio.gather(*[c.connect() for c in clients])
+        results = await asyncio.gather(*[c.ping() for c in clients])
+    """
+
+    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 1.0):
+        """
+        Initialize async Flipper connection.
+
+        Args:
+            port: Serial port path
+            baudrate: Serial baud rate (default 115200)
+            timeout: Default receive timeout in seconds
+        """
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+
+        self._transport: Optional[asyncio.Transport] = None
+        self._message_buffer = FlockMessageBuffer()
+        self._rx_queue: Optional[asyncio.Queue] = None
+
+        # send_and_receive requests awaiting a response, oldest first
+        self._pending_responses: List[Tuple[Optional[int], asyncio.Future]] = []
+
+    def is_connected(self) -> bool:
+        """Check if currently connected."""
+        return self._transport is not None and not self._transport.is_closing()
+
+    async def connect(self) -> bool:
+        """
+        Connect to the Flipper Zero.
+
+        Returns:
+            True if connection successful.
+        """
+        if self.is_connected():
+            return True
+        if serial_asyncio is None:
+            raise FlipperConnectionError("pyserial-asyncio is not installed")
+
+        loop = asyncio.get_running_loop()
+        self._rx_queue = asyncio.Queue()
+        try:
+            self._transport, _ = await serial_asyncio.create_serial_connection(
+                loop, lambda: _FlockSerialProtocol(self), self.port, baudrate=self.baudrate
+            )
+        except serial.SerialException as e:
+            logger.error(f"Failed to connect to {self.port}: {e}")
+            raise FlipperConnectionError(f"Failed to connect: {e}")
+
+        # Explicitly set DTR and RTS to signal connection
+        self._transport.serial.dtr = True
+        self._transport.serial.rts = True
+        await asyncio.sleep(0.2)  # Give the FAP time to recognize the connection
+        logger.info(f"Connected to Flipper Zero at {self.port} (async)")
+        return True
+
+    async def disconnect(self) -> None:
+        """Disconnect from the Flipper Zero."""
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+        self._message_buffer.clear()
+        self._fail_pending("Disconnected")
+        logger.info("Disconnected from Flipper Zero")
+
+    def send(self, data: bytes) -> None:
+        """Queue raw data for sending to the Flipper."""
+        if not self.is_connected():
+            raise FlipperConnectionError("Not connected")
+        self._transport.write(data)
+
+    async def receive(self, timeout: Optional[float] = None) -> Optional[Tuple[FlockMessageHeader, bytes]]:
+        """
+        Receive a single message that no pending request claimed.
+
+        Args:
+            timeout: Receive timeout in seconds (None = use default)
+
+        Returns:
+            Tuple of (header, payload) or None if timeout.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        try:
+            return await asyncio.wait_for(self._rx_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def send_and_receive(
+        self,
+        msg_type: FlockMessageType,
+        payload: bytes = b'',
+        expected_type: Optional[FlockMessageType] = None,
+        timeout: float = 5.0
+    ) -> Tuple[FlockMessageHeader, bytes]:
+        """
+        Send a message and wait for a response.
+
+        Responses are matched like FlipperConnection.send_async: in send
+        order, by expected type, with ERROR failing the oldest request.
+
+        Raises:
+            FlipperTimeoutError: If no response received within timeout.
+        """
+        future = asyncio.get_running_loop().create_future()
+        entry = (None if expected_type is None else int(expected_type), future)
+        self._pending_responses.append(entry)
+        try:
+            self.send(FlockProtocol.create_message(msg_type, payload))
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise FlipperTimeoutError(f"No response received within {timeout}s")
+        finally:
+            if entry in self._pending_responses:
+                self._pending_responses.remove(entry)
+
+    async def ping(self, timeout: float = 2.0) -> bool:
+        """
+        Send heartbeat and verify response.
+
+        Returns:
+            True if heartbeat response received.
+        """
+        try:
+            await self.send_and_receive(
+                FlockMessageType.HEARTBEAT,
+                expected_type=FlockMessageType.HEARTBEAT,
+                timeout=timeout
+            )
+            return True
+        except (FlipperTimeoutError, FlipperConnectionError):
+            return False
+
+    async def get_status(self, timeout: float = 5.0) -> FlockStatusResponse:
+        """
+        Request and return device status.
+
+        Returns:
+            FlockStatusResponse with current device state.
+        """
+        header, payload = await self.send_and_receive(
+            FlockMessageType.STATUS_REQUEST,
+            expected_type=FlockMessageType.STATUS_RESPONSE,
+            timeout=timeout
+        )
+        return FlockProtocol.parse_status_response(payload)
+
+    def _on_data(self, data: bytes) -> None:
+        """Frame incoming bytes and route each message."""
+        self._message_buffer.append(data)
+        for header, payload in self._message_buffer.get_messages():
+            if not self._resolve_pending(header, payload):
+                self._rx_queue.put_nowait((header, payload))
+
+    def _resolve_pending(self, header: FlockMessageHeader, payload: bytes) -> bool:
+        """Complete the pending request this message answers; False if none."""
+        msg_type = header.msg_type
+        pending = [entry for entry in self._pending_responses if not entry[1].done()]
+        self._pending_responses = pending
+
+        for i, (expected_type, future) in enumerate(pending):
+            if expected_type is None or msg_type == expected_type:
+                del pending[i]
+                future.set_result((header, payload))
+                return True
+
+        if msg_type == _MSG_TYPE_ERROR and pending:
+            _, future = pending.pop(0)
+            future.set_exception(_error_response_exception(payload))
+            return True
+
+        return False
+
+    def _on_connection_lost(self, exc: Optional[Exception]) -> None:
+        """Handle transport loss."""
+        if exc is not None:
+            logger.warning(f"Connection lost: {exc}")
+        self._transport = None
+        self._fail_pending("Connection lost")
+
+    def _fail_pending(self, reason: str) -> None:
+        """Fail every outstanding request."""
+        pending, self._pending_responses = self._pending_responses, []
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(FlipperConnectionError(reason))
+                # The waiter may already be gone (e.g. its task was cancelled
+                # mid-teardown); mark the exception retrieved so asyncio does
+                # not log "Future exception was never retrieved" for it
+                future.exception()
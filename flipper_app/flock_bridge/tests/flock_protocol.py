@@ -6,11 +6,16 @@ used for testing the FAP communication layer.
 """
 
 import struct
+import sys
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional, List, Tuple, Union
 import logging
 
+# Optional: only used by the parse_*_result_raw fast paths. Imported on
+# first use by _numpy(), since it costs more to import than this module
+np = None
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -22,6 +27,109 @@ FLOCK_HEADER_SIZE = 4
 FLOCK_MAX_PAYLOAD_SIZE = 2048
 FLOCK_MAX_MESSAGE_SIZE = FLOCK_HEADER_SIZE + FLOCK_MAX_PAYLOAD_SIZE
 
+# Message header: version, msg_type, payload_length (compiled once)
+FLOCK_HEADER_STRUCT = struct.Struct('<BBH')
+
+# Every frame starts with the version byte; the stream parser resyncs on it
+_FLOCK_VERSION_BYTE = bytes((FLOCK_PROTOCOL_VERSION,))
+
+# Fixed-layout record and payload formats, compiled once at import rather
+# than re-parsed from a format string on every pack/unpack. Fixed-width
+# strings use 's' fields, which truncate and NUL-pad in C; boolean flags
+# use '?', which packs any truthy value as 1 and unpacks straight to bool.
+_WIFI_NETWORK_STRUCT = struct.Struct('<33s6sbBB?')
+_SUBGHZ_DETECTION_STRUCT = struct.Struct('<IbBHIB16s')
+_BLE_DEVICE_STRUCT = struct.Struct('<6s32sbB?B64s2sB32s')
+_IR_DETECTION_STRUCT = struct.Struct('<IB16sII?b')
+_NFC_DETECTION_STRUCT = struct.Struct('<10sBBB2s16s')
+_STATUS_RESPONSE_STRUCT = struct.Struct('<B?????BI6H')
+_WIPS_ALERT_STRUCT = struct.Struct('<IBB33sB24s64s')
+_LF_PROBE_STRUCT = struct.Struct('<H')
+_IR_STROBE_STRUCT = struct.Struct('<HBH')
+_SUBGHZ_REPLAY_STRUCT = struct.Struct('<IHB')
+_SUBGHZ_SCAN_REQUEST_STRUCT = struct.Struct('<II')
+_RESULT_TIMESTAMP_STRUCT = struct.Struct('<I')
+_SUBGHZ_RESULT_HEADER_STRUCT = struct.Struct('<III')
+# Result payload prefixes including the record count byte, for encoding
+_RESULT_COUNT_STRUCT = struct.Struct('<IB')
+_SUBGHZ_RESULT_COUNT_STRUCT = struct.Struct('<IIIB')
+
+# Whole request frames (header followed by the fixed payload fields above),
+# so the create_* helpers emit a message in one pack call instead of
+# packing the payload and concatenating it onto a packed header
+_SUBGHZ_SCAN_REQUEST_MESSAGE = struct.Struct('<BBHII')
+_LF_PROBE_MESSAGE = struct.Struct('<BBHH')
+_IR_STROBE_MESSAGE = struct.Struct('<BBHHBH')
+_WIFI_PROBE_MESSAGE_PREFIX = struct.Struct('<BBHB')
+_SUBGHZ_REPLAY_MESSAGE_PREFIX = struct.Struct('<BBHIHB')
+
+# numpy structured dtype fields mirroring the record Structs above, for
+# decoding a whole scan result in one np.frombuffer call. Field names match
+# the dataclass attributes. The dtypes themselves are built on first access
+# as module attributes (WIFI_NETWORK_DTYPE etc.; None without numpy).
+_DTYPE_FIELDS = {
+    'WIFI_NETWORK_DTYPE': [
+        ('ssid', 'S33'), ('bssid', 'u1', (6,)), ('rssi', 'i1'),
+        ('channel', 'u1'), ('security', 'u1'), ('hidden', 'u1'),
+    ],
+    'BLE_DEVICE_DTYPE': [
+        ('mac_address', 'u1', (6,)), ('name', 'S32'), ('rssi', 'i1'),
+        ('address_type', 'u1'), ('is_connectable', 'u1'), ('service_uuid_count', 'u1'),
+        ('service_uuids', 'u1', (4, 16)), ('manufacturer_id', 'u1', (2,)),
+        ('manufacturer_data_len', 'u1'), ('manufacturer_data', 'u1', (32,)),
+    ],
+    'SUBGHZ_DETECTION_DTYPE': [
+        ('frequency', '<u4'), ('rssi', 'i1'), ('modulation', 'u1'),
+        ('duration_ms', '<u2'), ('bandwidth', '<u4'), ('protocol_id', 'u1'),
+        ('protocol_name', 'S16'),
+    ],
+    'NFC_DETECTION_DTYPE': [
+        ('uid', 'u1', (10,)), ('uid_len', 'u1'), ('nfc_type', 'u1'), ('sak', 'u1'),
+        ('atqa', 'u1', (2,)), ('type_name', 'S16'),
+    ],
+}
+
+
+def _numpy():
+    """Import numpy on first use; raises RuntimeError if it is not installed."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise RuntimeError("numpy is required for structured-array result parsing") from None
+        np = numpy
+    return np
+
+
+def _dtype(name: str) -> 'np.dtype':
+    """Build (once) and return the named record dtype."""
+    dtype = globals().get(name)
+    if dtype is None:
+        dtype = globals()[name] = _numpy().dtype(_DTYPE_FIELDS[name])
+    return dtype
+
+
+def __getattr__(name: str):
+    # Lazy WIFI_NETWORK_DTYPE etc.; after the first access they are plain
+    # module globals and this hook is no longer consulted
+    if name in _DTYPE_FIELDS:
+        try:
+            return _dtype(name)
+        except RuntimeError:
+            return None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _decode_ascii_fast(raw: bytes) -> str:
+    """Decode a text field, skipping the error-handling UTF-8 path for pure ASCII."""
+    # SSIDs and protocol names are almost always ASCII; isascii() is a single
+    # C scan and the strict decode is much cheaper than errors='replace'
+    if raw.isascii():
+        return raw.decode('ascii')
+    return raw.decode('utf-8', errors='replace')
+
+
 # ============================================================================
 # Message Types
 # ============================================================================
@@ -127,27 +235,33 @@ class WipsSeverity(IntEnum):
 # Data Structures
 # ============================================================================
 
-@dataclass
+# Records are created by the thousand while parsing scan bursts; slotted
+# instances are smaller and faster to build. dataclass slots need 3.10+, so
+# on 3.8/3.9 the records are silently left as regular __dict__ instances.
+_RECORD_DATACLASS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_RECORD_DATACLASS)
 class FlockMessageHeader:
     version: int = FLOCK_PROTOCOL_VERSION
     msg_type: int = 0
     payload_length: int = 0
 
     def pack(self) -> bytes:
-        return struct.pack('<BBH', self.version, self.msg_type, self.payload_length)
+        return FLOCK_HEADER_STRUCT.pack(self.version, self.msg_type, self.payload_length)
 
     @classmethod
     def unpack(cls, data: bytes) -> 'FlockMessageHeader':
         if len(data) < FLOCK_HEADER_SIZE:
             raise ValueError(f"Header too short: {len(data)} < {FLOCK_HEADER_SIZE}")
-        version, msg_type, payload_length = struct.unpack('<BBH', data[:FLOCK_HEADER_SIZE])
+        version, msg_type, payload_length = FLOCK_HEADER_STRUCT.unpack_from(data)
         return cls(version=version, msg_type=msg_type, payload_length=payload_length)
 
     def validate(self) -> bool:
         return self.version == FLOCK_PROTOCOL_VERSION
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockWifiNetwork:
     ssid: str = ""
     bssid: bytes = field(default_factory=lambda: bytes(6))
@@ -159,25 +273,22 @@ class FlockWifiNetwork:
     SIZE = 43  # 33 + 6 + 1 + 1 + 1 + 1
 
     def pack(self) -> bytes:
-        ssid_bytes = self.ssid.encode('utf-8')[:32].ljust(33, b'\x00')
-        return (
-            ssid_bytes +
-            self.bssid[:6].ljust(6, b'\x00') +
-            struct.pack('<bBBB', self.rssi, self.channel, self.security, 1 if self.hidden else 0)
+        return _WIFI_NETWORK_STRUCT.pack(
+            self.ssid.encode('utf-8')[:32], self.bssid,
+            self.rssi, self.channel, self.security, self.hidden
         )
 
     @classmethod
-    def unpack(cls, data: bytes) -> 'FlockWifiNetwork':
-        if len(data) < cls.SIZE:
-            raise ValueError(f"Network data too short: {len(data)} < {cls.SIZE}")
-        ssid = data[:33].rstrip(b'\x00').decode('utf-8', errors='replace')
-        bssid = data[33:39]
-        rssi, channel, security, hidden = struct.unpack('<bBBB', data[39:43])
+    def unpack(cls, data: bytes, offset: int = 0) -> 'FlockWifiNetwork':
+        if len(data) - offset < cls.SIZE:
+            raise ValueError(f"Network data too short: {len(data) - offset} < {cls.SIZE}")
+        ssid, bssid, rssi, channel, security, hidden = _WIFI_NETWORK_STRUCT.unpack_from(data, offset)
+        ssid = _decode_ascii_fast(ssid.rstrip(b'\x00'))
         return cls(ssid=ssid, bssid=bssid, rssi=rssi, channel=channel,
-                   security=WifiSecurityType(security), hidden=bool(hidden))
+                   security=WifiSecurityType(security), hidden=hidden)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockSubGhzDetection:
     frequency: int = 0
     rssi: int = 0
@@ -190,27 +301,25 @@ class FlockSubGhzDetection:
     SIZE = 29  # 4 + 1 + 1 + 2 + 4 + 1 + 16
 
     def pack(self) -> bytes:
-        name_bytes = self.protocol_name.encode('utf-8')[:15].ljust(16, b'\x00')
-        return struct.pack(
-            '<IbBHIB',
+        return _SUBGHZ_DETECTION_STRUCT.pack(
             self.frequency, self.rssi, self.modulation,
-            self.duration_ms, self.bandwidth, self.protocol_id
-        ) + name_bytes
+            self.duration_ms, self.bandwidth, self.protocol_id,
+            self.protocol_name.encode('utf-8')[:15]
+        )
 
     @classmethod
-    def unpack(cls, data: bytes) -> 'FlockSubGhzDetection':
-        if len(data) < cls.SIZE:
-            raise ValueError(f"SubGHz data too short: {len(data)} < {cls.SIZE}")
-        frequency, rssi, modulation, duration_ms, bandwidth, protocol_id = struct.unpack(
-            '<IbBHIB', data[:13]
-        )
-        protocol_name = data[13:29].rstrip(b'\x00').decode('utf-8', errors='replace')
+    def unpack(cls, data: bytes, offset: int = 0) -> 'FlockSubGhzDetection':
+        if len(data) - offset < cls.SIZE:
+            raise ValueError(f"SubGHz data too short: {len(data) - offset} < {cls.SIZE}")
+        (frequency, rssi, modulation, duration_ms, bandwidth, protocol_id,
+         protocol_name) = _SUBGHZ_DETECTION_STRUCT.unpack_from(data, offset)
+        protocol_name = _decode_ascii_fast(protocol_name.rstrip(b'\x00'))
         return cls(frequency=frequency, rssi=rssi, modulation=SubGhzModulation(modulation),
                    duration_ms=duration_ms, bandwidth=bandwidth, protocol_id=protocol_id,
                    protocol_name=protocol_name)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockBleDevice:
     mac_address: bytes = field(default_factory=lambda: bytes(6))
     name: str = ""
@@ -226,38 +335,34 @@ class FlockBleDevice:
     SIZE = 6 + 32 + 1 + 1 + 1 + 1 + 64 + 2 + 1 + 32  # 141 bytes
 
     def pack(self) -> bytes:
-        name_bytes = self.name.encode('utf-8')[:31].ljust(32, b'\x00')
-        uuid_bytes = b''.join(uuid[:16].ljust(16, b'\x00') for uuid in (self.service_uuids + [bytes(16)] * 4)[:4])
-        mfr_data = self.manufacturer_data[:32].ljust(32, b'\x00')
-        return (
-            self.mac_address[:6].ljust(6, b'\x00') +
-            name_bytes +
-            struct.pack('<bBBB', self.rssi, self.address_type,
-                       1 if self.is_connectable else 0, min(self.service_uuid_count, 4)) +
-            uuid_bytes +
-            self.manufacturer_id[:2].ljust(2, b'\x00') +
-            struct.pack('<B', min(self.manufacturer_data_len, 32)) +
-            mfr_data
+        # Only the UUID slots in use are padded; the 64s field zero-fills the rest
+        uuid_bytes = b''.join([uuid[:16].ljust(16, b'\x00') for uuid in self.service_uuids[:4]])
+        return _BLE_DEVICE_STRUCT.pack(
+            self.mac_address,
+            self.name.encode('utf-8')[:31],
+            self.rssi, self.address_type,
+            self.is_connectable, min(self.service_uuid_count, 4),
+            uuid_bytes,
+            self.manufacturer_id,
+            min(self.manufacturer_data_len, 32),
+            self.manufacturer_data
         )
 
     @classmethod
-    def unpack(cls, data: bytes) -> 'FlockBleDevice':
-        if len(data) < cls.SIZE:
-            raise ValueError(f"BLE device data too short: {len(data)} < {cls.SIZE}")
-        mac = data[:6]
-        name = data[6:38].rstrip(b'\x00').decode('utf-8', errors='replace')
-        rssi, addr_type, connectable, uuid_count = struct.unpack('<bBBB', data[38:42])
-        uuids = [data[42 + i*16:42 + (i+1)*16] for i in range(min(uuid_count, 4))]
-        mfr_id = data[106:108]
-        mfr_len = data[108]
-        mfr_data = data[109:141]
+    def unpack(cls, data: bytes, offset: int = 0) -> 'FlockBleDevice':
+        if len(data) - offset < cls.SIZE:
+            raise ValueError(f"BLE device data too short: {len(data) - offset} < {cls.SIZE}")
+        (mac, name, rssi, addr_type, connectable, uuid_count, uuid_bytes,
+         mfr_id, mfr_len, mfr_data) = _BLE_DEVICE_STRUCT.unpack_from(data, offset)
+        name = _decode_ascii_fast(name.rstrip(b'\x00'))
+        uuids = [uuid_bytes[i*16:(i+1)*16] for i in range(min(uuid_count, 4))]
         return cls(mac_address=mac, name=name, rssi=rssi, address_type=addr_type,
-                   is_connectable=bool(connectable), service_uuid_count=uuid_count,
+                   is_connectable=connectable, service_uuid_count=uuid_count,
                    service_uuids=uuids, manufacturer_id=mfr_id,
                    manufacturer_data_len=mfr_len, manufacturer_data=mfr_data)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockIrDetection:
     timestamp: int = 0
     protocol_id: int = 0
@@ -270,22 +375,23 @@ class FlockIrDetection:
     SIZE = 4 + 1 + 16 + 4 + 4 + 1 + 1  # 31 bytes
 
     def pack(self) -> bytes:
-        name_bytes = self.protocol_name.encode('utf-8')[:15].ljust(16, b'\x00')
-        return struct.pack('<IB', self.timestamp, self.protocol_id) + name_bytes + \
-               struct.pack('<IIBb', self.address, self.command, 1 if self.repeat else 0, self.signal_strength)
+        return _IR_DETECTION_STRUCT.pack(
+            self.timestamp, self.protocol_id, self.protocol_name.encode('utf-8')[:15],
+            self.address, self.command, self.repeat, self.signal_strength
+        )
 
     @classmethod
-    def unpack(cls, data: bytes) -> 'FlockIrDetection':
-        if len(data) < cls.SIZE:
-            raise ValueError(f"IR detection data too short: {len(data)} < {cls.SIZE}")
-        timestamp, protocol_id = struct.unpack('<IB', data[:5])
-        protocol_name = data[5:21].rstrip(b'\x00').decode('utf-8', errors='replace')
-        address, command, repeat, signal = struct.unpack('<IIBb', data[21:31])
+    def unpack(cls, data: bytes, offset: int = 0) -> 'FlockIrDetection':
+        if len(data) - offset < cls.SIZE:
+            raise ValueError(f"IR detection data too short: {len(data) - offset} < {cls.SIZE}")
+        (timestamp, protocol_id, protocol_name, address, command, repeat,
+         signal) = _IR_DETECTION_STRUCT.unpack_from(data, offset)
+        protocol_name = _decode_ascii_fast(protocol_name.rstrip(b'\x00'))
         return cls(timestamp=timestamp, protocol_id=protocol_id, protocol_name=protocol_name,
-                   address=address, command=command, repeat=bool(repeat), signal_strength=signal)
+                   address=address, command=command, repeat=repeat, signal_strength=signal)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockNfcDetection:
     uid: bytes = field(default_factory=lambda: bytes(10))
     uid_len: int = 0
@@ -297,24 +403,22 @@ class FlockNfcDetection:
     SIZE = 10 + 1 + 1 + 1 + 2 + 16  # 31 bytes
 
     def pack(self) -> bytes:
-        uid_bytes = self.uid[:10].ljust(10, b'\x00')
-        name_bytes = self.type_name.encode('utf-8')[:15].ljust(16, b'\x00')
-        return uid_bytes + struct.pack('<BBB', self.uid_len, self.nfc_type, self.sak) + \
-               self.atqa[:2].ljust(2, b'\x00') + name_bytes
+        return _NFC_DETECTION_STRUCT.pack(
+            self.uid, self.uid_len, self.nfc_type, self.sak,
+            self.atqa, self.type_name.encode('utf-8')[:15]
+        )
 
     @classmethod
-    def unpack(cls, data: bytes) -> 'FlockNfcDetection':
-        if len(data) < cls.SIZE:
-            raise ValueError(f"NFC detection data too short: {len(data)} < {cls.SIZE}")
-        uid = data[:10]
-        uid_len, nfc_type, sak = struct.unpack('<BBB', data[10:13])
-        atqa = data[13:15]
-        type_name = data[15:31].rstrip(b'\x00').decode('utf-8', errors='replace')
+    def unpack(cls, data: bytes, offset: int = 0) -> 'FlockNfcDetection':
+        if len(data) - offset < cls.SIZE:
+            raise ValueError(f"NFC detection data too short: {len(data) - offset} < {cls.SIZE}")
+        uid, uid_len, nfc_type, sak, atqa, type_name = _NFC_DETECTION_STRUCT.unpack_from(data, offset)
+        type_name = _decode_ascii_fast(type_name.rstrip(b'\x00'))
         return cls(uid=uid, uid_len=uid_len, nfc_type=nfc_type, sak=sak,
                    atqa=atqa, type_name=type_name)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockStatusResponse:
     protocol_version: int = FLOCK_PROTOCOL_VERSION
     wifi_board_connected: bool = False
@@ -334,14 +438,13 @@ class FlockStatusResponse:
     SIZE = 1 + 1 + 1 + 1 + 1 + 1 + 1 + 4 + 2*6  # 19 bytes
 
     def pack(self) -> bytes:
-        return struct.pack(
-            '<BBBBBBBI6H',
+        return _STATUS_RESPONSE_STRUCT.pack(
             self.protocol_version,
-            1 if self.wifi_board_connected else 0,
-            1 if self.subghz_ready else 0,
-            1 if self.ble_ready else 0,
-            1 if self.ir_ready else 0,
-            1 if self.nfc_ready else 0,
+            self.wifi_board_connected,
+            self.subghz_ready,
+            self.ble_ready,
+            self.ir_ready,
+            self.nfc_ready,
             self.battery_percent,
             self.uptime_seconds,
             self.wifi_scan_count,
@@ -356,26 +459,12 @@ class FlockStatusResponse:
     def unpack(cls, data: bytes) -> 'FlockStatusResponse':
         if len(data) < cls.SIZE:
             raise ValueError(f"Status response too short: {len(data)} < {cls.SIZE}")
-        values = struct.unpack('<BBBBBBBI6H', data[:cls.SIZE])
-        return cls(
-            protocol_version=values[0],
-            wifi_board_connected=bool(values[1]),
-            subghz_ready=bool(values[2]),
-            ble_ready=bool(values[3]),
-            ir_ready=bool(values[4]),
-            nfc_ready=bool(values[5]),
-            battery_percent=values[6],
-            uptime_seconds=values[7],
-            wifi_scan_count=values[8],
-            subghz_detection_count=values[9],
-            ble_scan_count=values[10],
-            ir_detection_count=values[11],
-            nfc_detection_count=values[12],
-            wips_alert_count=values[13]
-        )
+        # The wire layout lists the fields in declaration order, so the
+        # unpacked tuple maps straight onto the constructor
+        return cls(*_STATUS_RESPONSE_STRUCT.unpack_from(data))
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockWipsAlert:
     timestamp: int = 0
     alert_type: WipsAlertType = WipsAlertType.EVIL_TWIN
@@ -388,21 +477,23 @@ class FlockWipsAlert:
     SIZE = 4 + 1 + 1 + 33 + 1 + 24 + 64  # 128 bytes
 
     def pack(self) -> bytes:
-        ssid_bytes = self.ssid.encode('utf-8')[:32].ljust(33, b'\x00')
-        bssid_bytes = b''.join((b[:6].ljust(6, b'\x00') for b in (self.bssids + [bytes(6)] * 4)[:4]))
-        desc_bytes = self.description.encode('utf-8')[:63].ljust(64, b'\x00')
-        return struct.pack('<IBB', self.timestamp, self.alert_type, self.severity) + \
-               ssid_bytes + struct.pack('<B', min(self.bssid_count, 4)) + bssid_bytes + desc_bytes
+        # Only the BSSID slots in use are padded; the 24s field zero-fills the rest
+        bssid_bytes = b''.join([bssid[:6].ljust(6, b'\x00') for bssid in self.bssids[:4]])
+        return _WIPS_ALERT_STRUCT.pack(
+            self.timestamp, self.alert_type, self.severity,
+            self.ssid.encode('utf-8')[:32], min(self.bssid_count, 4), bssid_bytes,
+            self.description.encode('utf-8')[:63]
+        )
 
     @classmethod
     def unpack(cls, data: bytes) -> 'FlockWipsAlert':
         if len(data) < cls.SIZE:
             raise ValueError(f"WIPS alert too short: {len(data)} < {cls.SIZE}")
-        timestamp, alert_type, severity = struct.unpack('<IBB', data[:6])
-        ssid = data[6:39].rstrip(b'\x00').decode('utf-8', errors='replace')
-        bssid_count = data[39]
-        bssids = [data[40 + i*6:40 + (i+1)*6] for i in range(min(bssid_count, 4))]
-        description = data[64:128].rstrip(b'\x00').decode('utf-8', errors='replace')
+        (timestamp, alert_type, severity, ssid, bssid_count, bssid_bytes,
+         description) = _WIPS_ALERT_STRUCT.unpack_from(data)
+        ssid = _decode_ascii_fast(ssid.rstrip(b'\x00'))
+        bssids = [bssid_bytes[i*6:(i+1)*6] for i in range(min(bssid_count, 4))]
+        description = _decode_ascii_fast(description.rstrip(b'\x00'))
         return cls(timestamp=timestamp, alert_type=WipsAlertType(alert_type),
                    severity=WipsSeverity(severity), ssid=ssid, bssid_count=bssid_count,
                    bssids=bssids, description=description)
@@ -412,160 +503,274 @@ class FlockWipsAlert:
 # Active Probe Payloads
 # ============================================================================
 
-@dataclass
+# Device-side limits, shared by the payload classes and the FlockProtocol
+# create_* helpers so both encode paths clamp identically
+def _clamp_lf_duration(duration_ms: int) -> int:
+    return min(max(duration_ms, 100), 5000)
+
+
+def _clamp_ir_duration(duration_ms: int) -> int:
+    return min(max(duration_ms, 100), 10000)
+
+
+def _clamp_ir_duty_cycle(duty_cycle: int) -> int:
+    return min(duty_cycle, 100)
+
+
+def _clamp_replay_repeat(repeat_count: int) -> int:
+    return min(repeat_count, 100)
+
+
+_MAX_REPLAY_DATA_SIZE = 256
+
+
+@dataclass(**_RECORD_DATACLASS)
 class FlockLfProbePayload:
     duration_ms: int = 1000
 
     def pack(self) -> bytes:
-        return struct.pack('<H', min(max(self.duration_ms, 100), 5000))
+        return _LF_PROBE_STRUCT.pack(_clamp_lf_duration(self.duration_ms))
 
     @classmethod
     def unpack(cls, data: bytes) -> 'FlockLfProbePayload':
-        duration_ms = struct.unpack('<H', data[:2])[0]
+        duration_ms, = _LF_PROBE_STRUCT.unpack_from(data)
         return cls(duration_ms=duration_ms)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockIrStrobePayload:
     frequency_hz: int = 14
     duty_cycle: int = 50
     duration_ms: int = 1000
 
     def pack(self) -> bytes:
-        return struct.pack('<HBH', self.frequency_hz, min(self.duty_cycle, 100),
-                          min(max(self.duration_ms, 100), 10000))
+        return _IR_STROBE_STRUCT.pack(self.frequency_hz, _clamp_ir_duty_cycle(self.duty_cycle),
+                                      _clamp_ir_duration(self.duration_ms))
 
     @classmethod
     def unpack(cls, data: bytes) -> 'FlockIrStrobePayload':
-        freq, duty, dur = struct.unpack('<HBH', data[:5])
+        freq, duty, dur = _IR_STROBE_STRUCT.unpack_from(data)
         return cls(frequency_hz=freq, duty_cycle=duty, duration_ms=dur)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockWifiProbePayload:
     ssid: str = ""
 
     def pack(self) -> bytes:
         ssid_bytes = self.ssid.encode('utf-8')[:32]
-        return struct.pack('<B', len(ssid_bytes)) + ssid_bytes
+        return bytes((len(ssid_bytes),)) + ssid_bytes
 
     @classmethod
     def unpack(cls, data: bytes) -> 'FlockWifiProbePayload':
         ssid_len = data[0]
-        ssid = data[1:1+ssid_len].decode('utf-8', errors='replace')
+        ssid = _decode_ascii_fast(data[1:1+ssid_len])
         return cls(ssid=ssid)
 
 
-@dataclass
+@dataclass(**_RECORD_DATACLASS)
 class FlockSubGhzReplayPayload:
     frequency: int = 433920000
     data: bytes = field(default_factory=bytes)
     repeat_count: int = 1
 
-    MAX_DATA_SIZE = 256
+    MAX_DATA_SIZE = _MAX_REPLAY_DATA_SIZE
 
     def pack(self) -> bytes:
         data_bytes = self.data[:self.MAX_DATA_SIZE]
-        return struct.pack('<IHB', self.frequency, len(data_bytes),
-                          min(self.repeat_count, 100)) + data_bytes
+        return _SUBGHZ_REPLAY_STRUCT.pack(self.frequency, len(data_bytes),
+                                          _clamp_replay_repeat(self.repeat_count)) + data_bytes
 
     @classmethod
     def unpack(cls, data: bytes) -> 'FlockSubGhzReplayPayload':
-        frequency, data_len, repeat_count = struct.unpack('<IHB', data[:7])
+        frequency, data_len, repeat_count = _SUBGHZ_REPLAY_STRUCT.unpack_from(data)
         signal_data = data[7:7+data_len]
         return cls(frequency=frequency, data=signal_data, repeat_count=repeat_count)
 
 
+# ============================================================================
+# Column-Oriented Result View
+# ============================================================================
+
+class FlockRecordArray:
+    """
+    Scan result records kept as a numpy structured array (one column per field).
+
+    Column access (``devices['rssi'] > -70``) runs vectorized over the raw
+    records; masks and slices return another FlockRecordArray. Integer
+    indexing and iteration build the record dataclass on demand, so only
+    the rows actually inspected pay for object construction.
+    """
+
+    def __init__(self, record_cls, records: 'np.ndarray'):
+        self.record_cls = record_cls
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.records[key]
+        if isinstance(key, (int, _numpy().integer)):
+            return self.record_cls.unpack(self.records[key].tobytes())
+        return FlockRecordArray(self.record_cls, self.records[key])
+
+    def __iter__(self):
+        unpack = self.record_cls.unpack
+        for record in self.records:
+            yield unpack(record.tobytes())
+
+
 # ============================================================================
 # Protocol Encoder/Decoder
 # ============================================================================
 
+def _unpack_records(record_cls, payload: bytes, offset: int, count: int) -> list:
+    """Unpack up to count fixed-size records starting at offset, stopping at a short tail."""
+    # Clamp count to the whole records present once, up front, so the loop
+    # itself carries no bounds check. Records unpack in place at their
+    # offset, so no per-record slice is made either
+    size = record_cls.SIZE
+    count = min(count, (len(payload) - offset) // size)
+    unpack = record_cls.unpack
+    return [unpack(payload, pos) for pos in range(offset, offset + count * size, size)]
+
+
+def _records_array(dtype, payload: bytes, offset: int, count: int):
+    """View up to count records starting at offset as a numpy structured array."""
+    count = max(0, min(count, (len(payload) - offset) // dtype.itemsize))
+    return _numpy().frombuffer(payload, dtype=dtype, count=count, offset=offset)
+
+
+# Payload-less request frames never change; build them once and hand out the
+# same immutable bytes on every call
+_HEARTBEAT_MESSAGE = FLOCK_HEADER_STRUCT.pack(FLOCK_PROTOCOL_VERSION, FlockMessageType.HEARTBEAT, 0)
+_STATUS_REQUEST_MESSAGE = FLOCK_HEADER_STRUCT.pack(
+    FLOCK_PROTOCOL_VERSION, FlockMessageType.STATUS_REQUEST, 0)
+_WIFI_SCAN_REQUEST_MESSAGE = FLOCK_HEADER_STRUCT.pack(
+    FLOCK_PROTOCOL_VERSION, FlockMessageType.WIFI_SCAN_REQUEST, 0)
+_BLE_SCAN_REQUEST_MESSAGE = FLOCK_HEADER_STRUCT.pack(
+    FLOCK_PROTOCOL_VERSION, FlockMessageType.BLE_SCAN_REQUEST, 0)
+_IR_SCAN_REQUEST_MESSAGE = FLOCK_HEADER_STRUCT.pack(
+    FLOCK_PROTOCOL_VERSION, FlockMessageType.IR_SCAN_REQUEST, 0)
+_NFC_SCAN_REQUEST_MESSAGE = FLOCK_HEADER_STRUCT.pack(
+    FLOCK_PROTOCOL_VERSION, FlockMessageType.NFC_SCAN_REQUEST, 0)
+
+
 class FlockProtocol:
     """Encoder/decoder for Flock Bridge protocol messages."""
 
     @staticmethod
     def create_message(msg_type: FlockMessageType, payload: bytes = b'') -> bytes:
         """Create a complete message with header and payload."""
-        if len(payload) > FLOCK_MAX_PAYLOAD_SIZE:
-            raise ValueError(f"Payload too large: {len(payload)} > {FLOCK_MAX_PAYLOAD_SIZE}")
-        header = FlockMessageHeader(
-            version=FLOCK_PROTOCOL_VERSION,
-            msg_type=msg_type,
-            payload_length=len(payload)
-        )
-        return header.pack() + payload
+        payload_length = len(payload)
+        if payload_length > FLOCK_MAX_PAYLOAD_SIZE:
+            raise ValueError(f"Payload too large: {payload_length} > {FLOCK_MAX_PAYLOAD_SIZE}")
+        # IntEnum members pack as plain ints; no FlockMessageHeader is built
+        return FLOCK_HEADER_STRUCT.pack(FLOCK_PROTOCOL_VERSION, msg_type, payload_length) + payload
 
     @staticmethod
     def create_heartbeat() -> bytes:
         """Create a heartbeat request message."""
-        return FlockProtocol.create_message(FlockMessageType.HEARTBEAT)
+        return _HEARTBEAT_MESSAGE
 
     @staticmethod
     def create_status_request() -> bytes:
         """Create a status request message."""
-        return FlockProtocol.create_message(FlockMessageType.STATUS_REQUEST)
+        return _STATUS_REQUEST_MESSAGE
 
     @staticmethod
     def create_wifi_scan_request() -> bytes:
         """Create a WiFi scan request message."""
-        return FlockProtocol.create_message(FlockMessageType.WIFI_SCAN_REQUEST)
+        return _WIFI_SCAN_REQUEST_MESSAGE
 
     @staticmethod
     def create_subghz_scan_request(frequency_start: int = 300000000,
                                    frequency_end: int = 928000000) -> bytes:
         """Create a Sub-GHz scan request message."""
-        payload = struct.pack('<II', frequency_start, frequency_end)
-        return FlockProtocol.create_message(FlockMessageType.SUBGHZ_SCAN_REQUEST, payload)
+        return _SUBGHZ_SCAN_REQUEST_MESSAGE.pack(
+            FLOCK_PROTOCOL_VERSION, FlockMessageType.SUBGHZ_SCAN_REQUEST,
+            _SUBGHZ_SCAN_REQUEST_STRUCT.size, frequency_start, frequency_end)
 
     @staticmethod
     def create_ble_scan_request() -> bytes:
         """Create a BLE scan request message."""
-        return FlockProtocol.create_message(FlockMessageType.BLE_SCAN_REQUEST)
+        return _BLE_SCAN_REQUEST_MESSAGE
 
     @staticmethod
     def create_ir_scan_request() -> bytes:
         """Create an IR scan request message."""
-        return FlockProtocol.create_message(FlockMessageType.IR_SCAN_REQUEST)
+        return _IR_SCAN_REQUEST_MESSAGE
 
     @staticmethod
     def create_nfc_scan_request() -> bytes:
         """Create an NFC scan request message."""
-        return FlockProtocol.create_message(FlockMessageType.NFC_SCAN_REQUEST)
+        return _NFC_SCAN_REQUEST_MESSAGE
 
     @staticmethod
     def create_lf_probe(duration_ms: int = 1000) -> bytes:
         """Create an LF probe TX message."""
-        payload = FlockLfProbePayload(duration_ms=duration_ms)
-        return FlockProtocol.create_message(FlockMessageType.LF_PROBE_TX, payload.pack())
+        return _LF_PROBE_MESSAGE.pack(
+            FLOCK_PROTOCOL_VERSION, FlockMessageType.LF_PROBE_TX, _LF_PROBE_STRUCT.size,
+            _clamp_lf_duration(duration_ms))
 
     @staticmethod
     def create_ir_strobe(frequency_hz: int = 14, duty_cycle: int = 50,
                          duration_ms: int = 1000) -> bytes:
         """Create an IR strobe TX message."""
-        payload = FlockIrStrobePayload(frequency_hz=frequency_hz, duty_cycle=duty_cycle,
-                                       duration_ms=duration_ms)
-        return FlockProtocol.create_message(FlockMessageType.IR_STROBE_TX, payload.pack())
+        return _IR_STROBE_MESSAGE.pack(
+            FLOCK_PROTOCOL_VERSION, FlockMessageType.IR_STROBE_TX, _IR_STROBE_STRUCT.size,
+            frequency_hz, _clamp_ir_duty_cycle(duty_cycle), _clamp_ir_duration(duration_ms))
 
     @staticmethod
     def create_wifi_probe(ssid: str) -> bytes:
         """Create a WiFi probe TX message."""
-        payload = FlockWifiProbePayload(ssid=ssid)
-        return FlockProtocol.create_message(FlockMessageType.WIFI_PROBE_TX, payload.pack())
+        ssid_bytes = ssid.encode('utf-8')[:32]
+        return _WIFI_PROBE_MESSAGE_PREFIX.pack(
+            FLOCK_PROTOCOL_VERSION, FlockMessageType.WIFI_PROBE_TX,
+            1 + len(ssid_bytes), len(ssid_bytes)) + ssid_bytes
 
     @staticmethod
     def create_subghz_replay(frequency: int, data: bytes, repeat_count: int = 1) -> bytes:
         """Create a Sub-GHz replay TX message."""
-        payload = FlockSubGhzReplayPayload(frequency=frequency, data=data,
-                                           repeat_count=repeat_count)
-        return FlockProtocol.create_message(FlockMessageType.SUBGHZ_REPLAY_TX, payload.pack())
+        data_bytes = data[:_MAX_REPLAY_DATA_SIZE]
+        return _SUBGHZ_REPLAY_MESSAGE_PREFIX.pack(
+            FLOCK_PROTOCOL_VERSION, FlockMessageType.SUBGHZ_REPLAY_TX,
+            _SUBGHZ_REPLAY_STRUCT.size + len(data_bytes),
+            frequency, len(data_bytes), _clamp_replay_repeat(repeat_count)) + data_bytes
 
     @staticmethod
     def create_error(error_code: FlockErrorCode, message: str = "") -> bytes:
         """Create an error response message."""
         msg_bytes = message.encode('utf-8')[:64]
-        payload = struct.pack('<B', error_code) + msg_bytes
+        payload = bytes((error_code,)) + msg_bytes
         return FlockProtocol.create_message(FlockMessageType.ERROR, payload)
 
+    @staticmethod
+    def create_wifi_scan_result(timestamp: int, networks: List[FlockWifiNetwork]) -> bytes:
+        """Create a WiFi scan result message (as the FAP sends it)."""
+        payload = b''.join([_RESULT_COUNT_STRUCT.pack(timestamp, len(networks)),
+                            *[net.pack() for net in networks]])
+        return FlockProtocol.create_message(FlockMessageType.WIFI_SCAN_RESULT, payload)
+
+    @staticmethod
+    def create_subghz_scan_result(timestamp: int, frequency_start: int, frequency_end: int,
+                                  detections: List[FlockSubGhzDetection]) -> bytes:
+        """Create a Sub-GHz scan result message (as the FAP sends it)."""
+        payload = b''.join([
+            _SUBGHZ_RESULT_COUNT_STRUCT.pack(timestamp, frequency_start, frequency_end,
+                                             len(detections)),
+            *[det.pack() for det in detections]])
+        return FlockProtocol.create_message(FlockMessageType.SUBGHZ_SCAN_RESULT, payload)
+
+    @staticmethod
+    def create_nfc_scan_result(timestamp: int, detections: List[FlockNfcDetection]) -> bytes:
+        """Create an NFC scan result message (as the FAP sends it)."""
+        payload = b''.join([_RESULT_COUNT_STRUCT.pack(timestamp, len(detections)),
+                            *[det.pack() for det in detections]])
+        return FlockProtocol.create_message(FlockMessageType.NFC_SCAN_RESULT, payload)
+
     @staticmethod
     def parse_message(data: bytes) -> Tuple[FlockMessageHeader, bytes]:
         """Parse a message into header and payload."""
@@ -583,6 +788,21 @@ class FlockProtocol:
         payload = data[FLOCK_HEADER_SIZE:expected_size]
         return header, payload
 
+    @staticmethod
+    def decode_payload(msg_type: int, payload: bytes):
+        """
+        Decode a device-sent payload with the parser for its message type.
+
+        Looks the parser up in a table keyed by the plain int message type,
+        so stream consumers skip an if/elif chain per message. Returns what
+        the matching parse_* method returns.
+        """
+        try:
+            decoder = _PAYLOAD_DECODERS[msg_type]
+        except KeyError:
+            raise ValueError(f"No payload decoder for message type 0x{msg_type:02X}") from None
+        return decoder(payload)
+
     @staticmethod
     def parse_status_response(payload: bytes) -> FlockStatusResponse:
         """Parse a status response payload."""
@@ -594,7 +814,7 @@ class FlockProtocol:
         if len(payload) < 1:
             raise ValueError("Error payload too short")
         error_code = FlockErrorCode(payload[0])
-        message = payload[1:].decode('utf-8', errors='replace') if len(payload) > 1 else ""
+        message = _decode_ascii_fast(payload[1:]) if len(payload) > 1 else ""
         return error_code, message
 
     @staticmethod
@@ -602,67 +822,97 @@ class FlockProtocol:
         """Parse a WiFi scan result payload."""
         if len(payload) < 5:
             raise ValueError("WiFi result payload too short")
-        timestamp = struct.unpack('<I', payload[:4])[0]
+        timestamp, = _RESULT_TIMESTAMP_STRUCT.unpack_from(payload)
         count = payload[4]
-        networks = []
-        offset = 5
-        for _ in range(count):
-            if offset + FlockWifiNetwork.SIZE > len(payload):
-                break
-            network = FlockWifiNetwork.unpack(payload[offset:offset + FlockWifiNetwork.SIZE])
-            networks.append(network)
-            offset += FlockWifiNetwork.SIZE
+        networks = _unpack_records(FlockWifiNetwork, payload, 5, count)
         return timestamp, networks
 
+    @staticmethod
+    def parse_wifi_result_raw(payload: bytes) -> Tuple[int, 'np.ndarray']:
+        """
+        Parse a WiFi scan result payload into a WIFI_NETWORK_DTYPE array.
+
+        Decodes every record in one pass without building FlockWifiNetwork
+        objects; the array is a read-only view over payload. Requires numpy.
+        """
+        if len(payload) < 5:
+            raise ValueError("WiFi result payload too short")
+        timestamp, = _RESULT_TIMESTAMP_STRUCT.unpack_from(payload)
+        return timestamp, _records_array(_dtype('WIFI_NETWORK_DTYPE'), payload, 5, payload[4])
+
+    @staticmethod
+    def parse_wifi_result_columns(payload: bytes) -> Tuple[int, FlockRecordArray]:
+        """Parse a WiFi scan result payload into a column-oriented FlockRecordArray."""
+        timestamp, records = FlockProtocol.parse_wifi_result_raw(payload)
+        return timestamp, FlockRecordArray(FlockWifiNetwork, records)
+
     @staticmethod
     def parse_subghz_result(payload: bytes) -> Tuple[int, int, int, List[FlockSubGhzDetection]]:
         """Parse a Sub-GHz scan result payload."""
         if len(payload) < 13:
             raise ValueError("SubGHz result payload too short")
-        timestamp, freq_start, freq_end = struct.unpack('<III', payload[:12])
+        timestamp, freq_start, freq_end = _SUBGHZ_RESULT_HEADER_STRUCT.unpack_from(payload)
         count = payload[12]
-        detections = []
-        offset = 13
-        for _ in range(count):
-            if offset + FlockSubGhzDetection.SIZE > len(payload):
-                break
-            detection = FlockSubGhzDetection.unpack(payload[offset:offset + FlockSubGhzDetection.SIZE])
-            detections.append(detection)
-            offset += FlockSubGhzDetection.SIZE
+        detections = _unpack_records(FlockSubGhzDetection, payload, 13, count)
         return timestamp, freq_start, freq_end, detections
 
+    @staticmethod
+    def parse_subghz_result_raw(payload: bytes) -> Tuple[int, int, int, 'np.ndarray']:
+        """
+        Parse a Sub-GHz scan result payload into a SUBGHZ_DETECTION_DTYPE array.
+
+        Decodes every record in one pass without building FlockSubGhzDetection
+        objects; the array is a read-only view over payload. Requires numpy.
+        """
+        if len(payload) < 13:
+            raise ValueError("SubGHz result payload too short")
+        timestamp, freq_start, freq_end = _SUBGHZ_RESULT_HEADER_STRUCT.unpack_from(payload)
+        records = _records_array(_dtype('SUBGHZ_DETECTION_DTYPE'), payload, 13, payload[12])
+        return timestamp, freq_start, freq_end, records
+
+    @staticmethod
+    def parse_subghz_result_columns(payload: bytes) -> Tuple[int, int, int, FlockRecordArray]:
+        """Parse a Sub-GHz scan result payload into a column-oriented FlockRecordArray."""
+        timestamp, freq_start, freq_end, records = FlockProtocol.parse_subghz_result_raw(payload)
+        return timestamp, freq_start, freq_end, FlockRecordArray(FlockSubGhzDetection, records)
+
     @staticmethod
     def parse_ble_result(payload: bytes) -> Tuple[int, List[FlockBleDevice]]:
         """Parse a BLE scan result payload."""
         if len(payload) < 5:
             raise ValueError("BLE result payload too short")
-        timestamp = struct.unpack('<I', payload[:4])[0]
+        timestamp, = _RESULT_TIMESTAMP_STRUCT.unpack_from(payload)
         count = payload[4]
-        devices = []
-        offset = 5
-        for _ in range(count):
-            if offset + FlockBleDevice.SIZE > len(payload):
-                break
-            device = FlockBleDevice.unpack(payload[offset:offset + FlockBleDevice.SIZE])
-            devices.append(device)
-            offset += FlockBleDevice.SIZE
+        devices = _unpack_records(FlockBleDevice, payload, 5, count)
         return timestamp, devices
 
+    @staticmethod
+    def parse_ble_result_raw(payload: bytes) -> Tuple[int, 'np.ndarray']:
+        """
+        Parse a BLE scan result payload into a BLE_DEVICE_DTYPE array.
+
+        Decodes every record in one pass without building FlockBleDevice
+        objects; the array is a read-only view over payload. Requires numpy.
+        """
+        if len(payload) < 5:
+            raise ValueError("BLE result payload too short")
+        timestamp, = _RESULT_TIMESTAMP_STRUCT.unpack_from(payload)
+        return timestamp, _records_array(_dtype('BLE_DEVICE_DTYPE'), payload, 5, payload[4])
+
+    @staticmethod
+    def parse_ble_result_columns(payload: bytes) -> Tuple[int, FlockRecordArray]:
+        """Parse a BLE scan result payload into a column-oriented FlockRecordArray."""
+        timestamp, records = FlockProtocol.parse_ble_result_raw(payload)
+        return timestamp, FlockRecordArray(FlockBleDevice, records)
+
     @staticmethod
     def parse_ir_result(payload: bytes) -> Tuple[int, List[FlockIrDetection]]:
         """Parse an IR scan result payload."""
         if len(payload) < 5:
             raise ValueError("IR result payload too short")
-        timestamp = struct.unpack('<I', payload[:4])[0]
+        timestamp, = _RESULT_TIMESTAMP_STRUCT.unpack_from(payload)
         count = payload[4]
-        detections = []
-        offset = 5
-        for _ in range(count):
-            if offset + FlockIrDetection.SIZE > len(payload):
-                break
-            detection = FlockIrDetection.unpack(payload[offset:offset + FlockIrDetection.SIZE])
-            detections.append(detection)
-            offset += FlockIrDetection.SIZE
+        detections = _unpack_records(FlockIrDetection, payload, 5, count)
         return timestamp, detections
 
     @staticmethod
@@ -670,18 +920,43 @@ class FlockProtocol:
         """Parse an NFC scan result payload."""
         if len(payload) < 5:
             raise ValueError("NFC result payload too short")
-        timestamp = struct.unpack('<I', payload[:4])[0]
+        timestamp, = _RESULT_TIMESTAMP_STRUCT.unpack_from(payload)
         count = payload[4]
-        detections = []
-        offset = 5
-        for _ in range(count):
-            if offset + FlockNfcDetection.SIZE > len(payload):
-                break
-            detection = FlockNfcDetection.unpack(payload[offset:offset + FlockNfcDetection.SIZE])
-            detections.append(detection)
-            offset += FlockNfcDetection.SIZE
+        detections = _unpack_records(FlockNfcDetection, payload, 5, count)
         return timestamp, detections
 
+    @staticmethod
+    def parse_nfc_result_raw(payload: bytes) -> Tuple[int, 'np.ndarray']:
+        """
+        Parse an NFC scan result payload into an NFC_DETECTION_DTYPE array.
+
+        Decodes every record in one pass without building FlockNfcDetection
+        objects; the array is a read-only view over payload. Requires numpy.
+        """
+        if len(payload) < 5:
+            raise ValueError("NFC result payload too short")
+        timestamp, = _RESULT_TIMESTAMP_STRUCT.unpack_from(payload)
+        return timestamp, _records_array(_dtype('NFC_DETECTION_DTYPE'), payload, 5, payload[4])
+
+    @staticmethod
+    def parse_nfc_result_columns(payload: bytes) -> Tuple[int, FlockRecordArray]:
+        """Parse an NFC scan result payload into a column-oriented FlockRecordArray."""
+        timestamp, records = FlockProtocol.parse_nfc_result_raw(payload)
+        return timestamp, FlockRecordArray(FlockNfcDetection, records)
+
+
+# Payload parsers for the message types the FAP sends, built once at import
+_PAYLOAD_DECODERS = {
+    int(FlockMessageType.WIFI_SCAN_RESULT): FlockProtocol.parse_wifi_result,
+    int(FlockMessageType.SUBGHZ_SCAN_RESULT): FlockProtocol.parse_subghz_result,
+    int(FlockMessageType.STATUS_RESPONSE): FlockStatusResponse.unpack,
+    int(FlockMessageType.WIPS_ALERT): FlockWipsAlert.unpack,
+    int(FlockMessageType.BLE_SCAN_RESULT): FlockProtocol.parse_ble_result,
+    int(FlockMessageType.IR_SCAN_RESULT): FlockProtocol.parse_ir_result,
+    int(FlockMessageType.NFC_SCAN_RESULT): FlockProtocol.parse_nfc_result,
+    int(FlockMessageType.ERROR): FlockProtocol.parse_error,
+}
+
 
 # ============================================================================
 # Message Buffer for Stream Processing
@@ -698,43 +973,55 @@ class FlockMessageBuffer:
         """Append data to the buffer."""
         self.buffer.extend(data)
         # Prevent unbounded growth
-        if len(self.buffer) > self.max_size:
-            # Keep only the last max_size bytes
-            self.buffer = self.buffer[-self.max_size:]
+        overflow = len(self.buffer) - self.max_size
+        if overflow > 0:
+            # Keep only the last max_size bytes; dropping the prefix in place
+            # avoids copying the kept tail into a new bytearray
+            del self.buffer[:overflow]
             logger.warning(f"Message buffer overflow, truncated to {self.max_size} bytes")
 
     def get_messages(self) -> List[Tuple[FlockMessageHeader, bytes]]:
         """Extract all complete messages from the buffer."""
         messages = []
-
-        while len(self.buffer) >= FLOCK_HEADER_SIZE:
-            try:
-                header = FlockMessageHeader.unpack(bytes(self.buffer))
-            except ValueError:
-                # Invalid header, skip one byte and try again
-                self.buffer = self.buffer[1:]
-                continue
-
-            if not header.validate():
-                # Invalid version, skip one byte
-                self.buffer = self.buffer[1:]
-                continue
-
-            # Check if payload is valid
-            if header.payload_length > FLOCK_MAX_PAYLOAD_SIZE:
-                # Invalid payload length, skip header
-                self.buffer = self.buffer[1:]
-                continue
-
-            msg_size = FLOCK_HEADER_SIZE + header.payload_length
-            if len(self.buffer) < msg_size:
-                # Incomplete message, wait for more data
-                break
-
-            # Extract complete message
-            payload = bytes(self.buffer[FLOCK_HEADER_SIZE:msg_size])
-            messages.append((header, payload))
-            self.buffer = self.buffer[msg_size:]
+        buffer = self.buffer
+        end = len(buffer)
+        # Walk the buffer by offset and drop consumed bytes once at the end,
+        # rather than re-slicing the bytearray after every frame
+        offset = 0
+        unpack_header = FLOCK_HEADER_STRUCT.unpack_from
+        find = buffer.find
+
+        with memoryview(buffer) as view:
+            while end - offset >= FLOCK_HEADER_SIZE:
+                version, msg_type, payload_length = unpack_header(buffer, offset)
+
+                # Invalid version or payload length: not a frame start. Jump
+                # to the next version byte in one C-level scan rather than
+                # re-unpacking a header at every garbage byte
+                if version != FLOCK_PROTOCOL_VERSION or payload_length > FLOCK_MAX_PAYLOAD_SIZE:
+                    offset = find(_FLOCK_VERSION_BYTE, offset + 1)
+                    if offset < 0:
+                        offset = end
+                        break
+                    continue
+
+                # Valid header: the length prefix says exactly where this
+                # frame ends and the next one starts
+                msg_end = offset + FLOCK_HEADER_SIZE + payload_length
+                if end < msg_end:
+                    # Incomplete message, wait for more data
+                    break
+
+                # Extract complete message
+                header = FlockMessageHeader(
+                    version=version, msg_type=msg_type, payload_length=payload_length
+                )
+                payload = view[offset + FLOCK_HEADER_SIZE:msg_end].tobytes()
+                messages.append((header, payload))
+                offset = msg_end
+
+        if offset:
+            del buffer[:offset]
 
         return messages
 
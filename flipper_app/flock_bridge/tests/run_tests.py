@@ -17,43 +17,96 @@ Usage:
     # Run specific test file
     python run_tests.py file tests/unit/test_protocol.py
 
+    # Run several files in one session (one Flipper connection for all)
+    python run_tests.py file e2e/test_fap_communication.py e2e/test_subghz_ble.py
+
     # Run with verbose output
     python run_tests.py unit -v
 
+    # Run unit tests across all cores (requires pytest-xdist)
+    python run_tests.py unit --jobs auto
+
     # List available Flipper ports
     python run_tests.py detect
+
+    # Run pytest in a fresh interpreter instead of in-process (CI isolation)
+    python run_tests.py --subprocess unit
+
+    # Byte-compile the shared helper modules before the unit run
+    python run_tests.py --warm unit
 """
 
 import argparse
+import compileall
+import importlib.util
 import subprocess
 import sys
 import os
 from pathlib import Path
 
 
+# pytest options that read or write .pytest_cache and so need the cacheprovider
+CACHE_OPTIONS = {
+    "--lf", "--last-failed", "--ff", "--failed-first", "--nf", "--new-first",
+    "--sw", "--stepwise", "--sw-skip", "--stepwise-skip", "--cache-show", "--cache-clear",
+}
+
+
 def get_test_dir():
     """Get the tests directory path."""
     return Path(__file__).parent
 
 
-def run_pytest(args: list, cwd: Path = None) -> int:
-    """Run pytest with given arguments."""
+def run_pytest(args: list, cwd: Path = None, jobs: str = None) -> int:
+    """Run pytest with given arguments, sharded over jobs xdist workers if requested."""
+    if jobs and jobs != "1":
+        if importlib.util.find_spec("xdist") is not None:
+            args = ["-n", str(jobs)] + args
+        else:
+            print("pytest-xdist not installed; running serially")
+    # Skip .pytest_cache reads/writes for short dev-loop runs unless asked for
+    if os.environ.get("FLOCK_TESTS_CACHE") != "1" and not CACHE_OPTIONS.intersection(args):
+        args = ["-p", "no:cacheprovider"] + args
     cmd = [sys.executable, "-m", "pytest"] + args
+    cwd = cwd or get_test_dir()
     print(f"Running: {' '.join(cmd)}")
-    return subprocess.call(cmd, cwd=cwd or get_test_dir())
+    if os.environ.get("FLOCK_TESTS_SUBPROCESS") == "1":
+        return subprocess.call(cmd, cwd=cwd)
+
+    # Run in this interpreter: skips a second Python startup and re-importing
+    # pytest and its plugins. Imported lazily so `install` works without pytest.
+    # pytest resolves paths against the cwd, so switch only for the run
+    import pytest
+    previous_cwd = os.getcwd()
+    os.chdir(cwd)
+    try:
+        return pytest.main(args)
+    finally:
+        os.chdir(previous_cwd)
 
 
-def run_unit_tests(extra_args: list = None) -> int:
+def warm_bytecode() -> None:
+    """Byte-compile the helper modules the tests import, using all cores."""
+    # Test files themselves are assertion-rewritten and cached by pytest, so
+    # only the top-level helpers (flock_protocol, flipper_connection, ...)
+    # benefit from compileall
+    compileall.compile_dir(get_test_dir(), maxlevels=0, quiet=1, workers=0)
+
+
+def run_unit_tests(extra_args: list = None, jobs: str = None) -> int:
     """Run unit tests only."""
+    if os.environ.get("FLOCK_TESTS_WARM") == "1":
+        warm_bytecode()
     args = ["unit/", "-v"]
     if extra_args:
         args.extend(extra_args)
-    return run_pytest(args)
+    return run_pytest(args, jobs=jobs)
 
 
 def run_e2e_tests(extra_args: list = None, flipper_port: str = None) -> int:
     """Run end-to-end tests."""
-    args = ["e2e/", "-v", "--flipper-required"]
+    # One Flipper is a single shared resource; never shard e2e across workers
+    args = ["e2e/", "-v", "--flipper-required", "-p", "no:xdist"]
     if flipper_port:
         args.extend(["--flipper-port", flipper_port])
     if extra_args:
@@ -61,31 +114,34 @@ def run_e2e_tests(extra_args: list = None, flipper_port: str = None) -> int:
     return run_pytest(args)
 
 
-def run_all_tests(extra_args: list = None, with_coverage: bool = False) -> int:
+def run_all_tests(extra_args: list = None, with_coverage: bool = False, jobs: str = None) -> int:
     """Run all tests."""
     args = ["."]
     if with_coverage:
         args.extend(["--cov=.", "--cov-report=html", "--cov-report=term"])
     if extra_args:
         args.extend(extra_args)
-    return run_pytest(args)
+    return run_pytest(args, jobs=jobs)
 
 
-def run_specific_file(filepath: str, extra_args: list = None) -> int:
-    """Run tests in a specific file."""
-    args = [filepath]
+def run_specific_files(filepaths: list, extra_args: list = None, jobs: str = None) -> int:
+    """Run tests in specific files, in a single pytest session."""
+    args = list(filepaths)
     if extra_args:
         args.extend(extra_args)
-    return run_pytest(args)
+    return run_pytest(args, jobs=jobs)
 
 
 def detect_flipper() -> None:
     """Detect and list available Flipper devices."""
+    test_dir = str(get_test_dir())
+    if test_dir not in sys.path:
+        sys.path.insert(0, test_dir)
     try:
         from flipper_connection import FlipperConnection
-    except ImportError:
-        print("Error: flipper_connection module not found.")
-        print("Make sure you're running from the tests directory.")
+    except ImportError as e:
+        print(f"Error: could not import flipper_connection: {e}")
+        print("Make sure the test dependencies are installed (run_tests.py install).")
         sys.exit(1)
 
     print("Searching for Flipper Zero devices...")
@@ -150,9 +206,12 @@ def install_dependencies() -> int:
         print(f"Requirements file not found: {requirements}")
         return 1
 
-    cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements)]
+    # Prefer wheels over building sdists, and skip pip's self-update check
+    # (a network round-trip on every install)
+    cmd = [sys.executable, "-m", "pip", "install", "--prefer-binary", "-r", str(requirements)]
+    env = dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK="1")
     print(f"Running: {' '.join(cmd)}")
-    return subprocess.call(cmd)
+    return subprocess.call(cmd, env=env)
 
 
 def main():
@@ -162,12 +221,19 @@ def main():
         epilog=__doc__
     )
 
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Run pytest in a child interpreter instead of in-process")
+    parser.add_argument("--with-cache", action="store_true",
+                        help="Keep pytest's .pytest_cache (needed for --lf/--ff)")
+    parser.add_argument("--warm", action="store_true",
+                        help="Byte-compile helper modules before running unit tests")
     subparsers = parser.add_subparsers(dest="command", help="Test command")
 
     # Unit tests
     unit_parser = subparsers.add_parser("unit", help="Run unit tests")
     unit_parser.add_argument("-v", "--verbose", action="store_true")
     unit_parser.add_argument("-k", "--keyword", help="Run tests matching keyword")
+    unit_parser.add_argument("-j", "--jobs", help="pytest-xdist workers (N or 'auto')")
     unit_parser.add_argument("extra", nargs="*", help="Additional pytest arguments")
 
     # E2E tests
@@ -182,12 +248,14 @@ def main():
     all_parser.add_argument("--coverage", action="store_true", help="Run with coverage")
     all_parser.add_argument("--flipper-port", help="Flipper serial port")
     all_parser.add_argument("-v", "--verbose", action="store_true")
+    all_parser.add_argument("-j", "--jobs", help="pytest-xdist workers (N or 'auto')")
     all_parser.add_argument("extra", nargs="*", help="Additional pytest arguments")
 
     # Specific file
-    file_parser = subparsers.add_parser("file", help="Run specific test file")
-    file_parser.add_argument("filepath", help="Path to test file")
+    file_parser = subparsers.add_parser("file", help="Run specific test files")
+    file_parser.add_argument("filepaths", nargs="+", help="Paths to test files")
     file_parser.add_argument("-v", "--verbose", action="store_true")
+    file_parser.add_argument("-j", "--jobs", help="pytest-xdist workers (N or 'auto')")
     file_parser.add_argument("extra", nargs="*", help="Additional pytest arguments")
 
     # Detect Flipper
@@ -197,9 +265,12 @@ def main():
     install_parser = subparsers.add_parser("install", help="Install test dependencies")
 
     args = parser.parse_args()
-
-    # Change to tests directory
-    os.chdir(get_test_dir())
+    if args.subprocess:
+        os.environ["FLOCK_TESTS_SUBPROCESS"] = "1"
+    if args.with_cache:
+        os.environ["FLOCK_TESTS_CACHE"] = "1"
+    if args.warm:
+        os.environ["FLOCK_TESTS_WARM"] = "1"
 
     if args.command == "unit":
         extra = args.extra or []
@@ -207,7 +278,7 @@ def main():
             extra.append("-vv")
         if args.keyword:
             extra.extend(["-k", args.keyword])
-        sys.exit(run_unit_tests(extra))
+        sys.exit(run_unit_tests(extra, args.jobs))
 
     elif args.command == "e2e":
         extra = args.extra or []
@@ -223,13 +294,13 @@ def main():
             extra.append("-vv")
         if args.flipper_port:
             extra.extend(["--flipper-port", args.flipper_port, "--flipper-required"])
-        sys.exit(run_all_tests(extra, args.coverage))
+        sys.exit(run_all_tests(extra, args.coverage, args.jobs))
 
     elif args.command == "file":
         extra = args.extra or []
         if args.verbose:
             extra.append("-vv")
-        sys.exit(run_specific_file(args.filepath, extra))
+        sys.exit(run_specific_files(args.filepaths, extra, args.jobs))
 
     elif args.command == "detect":
         detect_flipper()
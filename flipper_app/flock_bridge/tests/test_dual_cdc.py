@@ -17,61 +17,169 @@ import serial.tools.list_ports
 import time
 import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def find_flipper_ports():
-    """Find all Flipper serial ports."""
-    ports = []
-    for port in serial.tools.list_ports.comports():
-        if 'flip' in port.device.lower() or (port.vid == 1155 and port.pid in [22336, 22337]):
-            ports.append(port.device)
-    return sorted(ports)
+# struct serial_struct layout on 64-bit Linux (matches FlipperConnection)
+SERIAL_STRUCT_SIZE = 72
+SERIAL_STRUCT_FLAGS_OFFSET = 16
+ASYNC_LOW_LATENCY = 0x2000
+
+# Flock message header: version, type, payload length
+_HEADER = struct.Struct('<BBH')
+# Heartbeat: version=1, type=0, length=0
+_HEARTBEAT = _HEADER.pack(1, 0, 0)
+# Any of these in the reply to a newline + help marks the Flipper CLI
+_CLI_SENTINELS = (b'>:', b'Flipper', b'help', b'Commands', b'?')
+
+def find_flipper_ports(all_ports=None):
+    """Find all Flipper serial ports, VID/PID matches first, then name matches."""
+    if all_ports is None:
+        all_ports = serial.tools.list_ports.comports()
+    known_vidpid = []
+    name_match = []
+    for port in all_ports:
+        if port.vid == 1155 and port.pid in [22336, 22337]:
+            known_vidpid.append(port.device)
+        elif 'flip' in port.device.lower():
+            name_match.append(port.device)
+    return sorted(known_vidpid) + sorted(name_match)
+
+def dual_cdc_roles(all_ports):
+    """
+    Map device -> 'cli' or 'flock' for a Flipper enumerated in dual CDC mode.
+
+    Both channels share one VID/PID, so roles come from the USB interface
+    number in the port location (channel 0 = CLI, channel 1 = Flock). Ports
+    without interface info, or a Flipper in single CDC mode, are left out.
+    """
+    by_device = {}
+    for port in all_ports:
+        if port.vid == 1155 and port.pid in [22336, 22337] and port.location and ':' in port.location:
+            usb_path, _, interface = port.location.rpartition(':')
+            by_device.setdefault(usb_path, []).append((interface, port.device))
+
+    roles = {}
+    for interfaces in by_device.values():
+        if len(interfaces) == 2:
+            (_, cli_device), (_, flock_device) = sorted(interfaces)
+            roles[cli_device] = 'cli'
+            roles[flock_device] = 'flock'
+    return roles
+
+def set_low_latency(ser):
+    """Set ASYNC_LOW_LATENCY so the cdc_acm driver hands bytes over immediately (Linux only)."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+        import termios
+        fd = ser.fileno()
+        info = bytearray(fcntl.ioctl(fd, termios.TIOCGSERIAL, bytes(SERIAL_STRUCT_SIZE)))
+        flags, = struct.unpack_from('i', info, SERIAL_STRUCT_FLAGS_OFFSET)
+        struct.pack_into('i', info, SERIAL_STRUCT_FLAGS_OFFSET, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, termios.TIOCSSERIAL, bytes(info))
+    except (ImportError, AttributeError, OSError, serial.SerialException):
+        return False
+    return True
 
 def send_heartbeat(ser, timeout=1.0):
     """Send heartbeat and wait for response."""
-    # Heartbeat: version=1, type=0, length=0
-    heartbeat = struct.pack('<BBH', 1, 0, 0)
-
     ser.reset_input_buffer()
-    ser.write(heartbeat)
+    ser.write(_HEARTBEAT)
 
-    start = time.time()
-    response = b''
-    while time.time() - start < timeout:
-        if ser.in_waiting > 0:
-            data = ser.read(ser.in_waiting)
-            response += data
-            if len(response) >= 4:
-                break
-        time.sleep(0.05)
+    # Block in the driver until the header arrives instead of polling; the
+    # read returns as soon as 4 bytes are in, or empty-handed at timeout
+    previous_timeout = ser.timeout
+    ser.timeout = timeout
+    try:
+        response = ser.read(4)
+        if len(response) == 4:
+            version, _, length = _HEADER.unpack(response)
+            if version == 1 and 0 < length <= 2048:
+                response += ser.read(length)
+    finally:
+        ser.timeout = previous_timeout
 
     return response
 
-def test_cli(ser):
+def test_cli(ser, timeout=0.8):
     """Test if this is a CLI port."""
+    # The CLI prints a prompt for the bare newline and a command list for
+    # help, so one write covers both probes; stop at the first sentinel
     ser.reset_input_buffer()
-    ser.write(b'\r\n')
-    time.sleep(0.3)
+    ser.write(b'\r\nhelp\r\n')
 
-    response = ser.read(1000)
-    if b'>:' in response or b'Flipper' in response or b'help' in response:
-        return True
+    response = b''
+    previous_timeout = ser.timeout
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            ser.timeout = remaining
+            response += ser.read(ser.in_waiting or 1)
+            if any(token in response for token in _CLI_SENTINELS):
+                return True
+    finally:
+        ser.timeout = previous_timeout
+
+def probe_port(port, role=None):
+    """
+    Probe one port for the Flock protocol and the CLI; returns (port, ser, is_flock, is_cli, log lines).
+
+    A role from dual_cdc_roles() limits the probe to verifying that role.
+    A port that answers the heartbeat is returned still open as ser (None
+    otherwise) so the extended test can reuse it; the caller closes it.
+    """
+    lines = [f"\n--- Testing {port} ---" + (f" (expected {role})" if role else "")]
+    is_flock = False
+    is_cli = False
+    ser = None
+    try:
+        ser = serial.Serial(port, 115200, timeout=1)
+        set_low_latency(ser)
+
+        # First test for Flock protocol; a known CLI interface skips it
+        if role != 'cli':
+            lines.append("  Sending heartbeat...")
+            response = send_heartbeat(ser, timeout=1.0)
+
+            if response:
+                lines.append(f"  Heartbeat response: {response.hex()}")
+                if len(response) >= 4:
+                    version, msg_type, length = _HEADER.unpack_from(response)
+                    lines.append(f"  Parsed: version={version}, type={msg_type}, length={length}")
+                    if version == 1 and msg_type == 0:
+                        lines.append(f"  ✓ This is the FLOCK PROTOCOL port!")
+                        is_flock = True
+            else:
+                lines.append("  No heartbeat response")
 
-    # Try help command
-    ser.write(b'help\r\n')
-    time.sleep(0.5)
-    response = ser.read(2000)
-    if b'?' in response or b'help' in response or b'Commands' in response:
-        return True
+        # Test for CLI
+        if not is_flock and role != 'flock':
+            lines.append("  Testing for CLI...")
+            if test_cli(ser):
+                lines.append(f"  ✓ This is the CLI port")
+                is_cli = True
+            else:
+                lines.append("  Not responding as CLI")
+    except Exception as e:
+        lines.append(f"  Error: {e}")
 
-    return False
+    if ser and not is_flock:
+        ser.close()
+        ser = None
+    return port, ser, is_flock, is_cli, lines
 
 def main():
     print("=" * 60)
     print("Flock Bridge Dual CDC Test")
     print("=" * 60)
 
-    # Find ports
-    ports = find_flipper_ports()
+    # Find ports; enumerate once, it is slow on Windows
+    all_ports = list(serial.tools.list_ports.comports())
+    ports = find_flipper_ports(all_ports)
     print(f"\nFound Flipper ports: {ports}")
 
     if not ports:
@@ -79,47 +187,34 @@ def main():
         print("Make sure Flipper is connected via USB.")
 
         print("\nAll available ports:")
-        for port in serial.tools.list_ports.comports():
+        for port in all_ports:
             print(f"  {port.device}: {port.description}")
         return 1
 
-    # Analyze each port
+    # Analyze all ports at once; each probe is mostly waiting on serial I/O
     cli_port = None
     flock_port = None
 
-    for port in ports:
-        print(f"\n--- Testing {port} ---")
-        try:
-            ser = serial.Serial(port, 115200, timeout=1)
-            time.sleep(0.3)
-
-            # First test for Flock protocol
-            print("  Sending heartbeat...")
-            response = send_heartbeat(ser, timeout=1.0)
-
-            if response:
-                print(f"  Heartbeat response: {response.hex()}")
-                if len(response) >= 4:
-                    version, msg_type, length = struct.unpack('<BBH', response[:4])
-                    print(f"  Parsed: version={version}, type={msg_type}, length={length}")
-                    if version == 1 and msg_type == 0:
-                        print(f"  ✓ This is the FLOCK PROTOCOL port!")
-                        flock_port = port
-            else:
-                print("  No heartbeat response")
-
-            # Test for CLI
-            if not flock_port or port != flock_port:
-                print("  Testing for CLI...")
-                if test_cli(ser):
-                    print(f"  ✓ This is the CLI port")
-                    cli_port = port
-                else:
-                    print("  Not responding as CLI")
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        roles = dual_cdc_roles(all_ports)
+        futures = [executor.submit(probe_port, port, roles.get(port)) for port in ports]
+        results = {}
+        for future in as_completed(futures):
+            port, ser, is_flock, is_cli, lines = future.result()
+            results[port] = (ser, is_flock, is_cli, lines)
 
+    # Report in priority order so output doesn't interleave between ports
+    flock_ser = None
+    for port in ports:
+        ser, is_flock, is_cli, lines = results[port]
+        print("\n".join(lines))
+        if is_flock and not flock_port:
+            flock_port = port
+            flock_ser = ser
+        elif ser:
             ser.close()
-        except Exception as e:
-            print(f"  Error: {e}")
+        if is_cli and not cli_port:
+            cli_port = port
 
     print("\n" + "=" * 60)
     print("RESULTS")
@@ -153,10 +248,8 @@ def main():
     if flock_port:
         print("\n" + "-" * 60)
         print("Running extended Flock protocol test...")
+        ser = flock_ser  # still open from the probe
         try:
-            ser = serial.Serial(flock_port, 115200, timeout=2)
-            time.sleep(0.3)
-
             # Test multiple heartbeats
             for i in range(3):
                 response = send_heartbeat(ser, timeout=1.0)
@@ -166,12 +259,13 @@ def main():
                     print(f"  Heartbeat {i+1}: no response ✗")
                 time.sleep(0.2)
 
-            ser.close()
             print("\nTest complete!")
             return 0
         except Exception as e:
             print(f"Error during extended test: {e}")
             return 1
+        finally:
+            ser.close()
 
     return 0 if flock_port else 1
 
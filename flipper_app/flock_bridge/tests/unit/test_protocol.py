@@ -2,11 +2,16 @@
 Unit tests for Flock Protocol encoding/decoding.
 
 These tests verify the Python protocol implementation matches the C implementation,
-without requiring a connected Flipper Zero.
+and exercise the sync and asyncio connections' response matching over fake
+serial ports, without requiring a connected Flipper Zero.
 """
 
+import asyncio
+import gc
 import pytest
 import struct
+import threading
+from dataclasses import fields
 from hypothesis import given, strategies as st, settings
 
 import sys
@@ -23,6 +28,9 @@ from flock_protocol import (
     FLOCK_PROTOCOL_VERSION, FLOCK_HEADER_SIZE, FLOCK_MAX_PAYLOAD_SIZE,
     FLOCK_MAX_MESSAGE_SIZE
 )
+from flipper_connection import (
+    AsyncFlipperConnection, FlipperConnection, FlipperConnectionError, FlipperTimeoutError
+)
 
 
 class TestFlockMessageHeader:
@@ -280,6 +288,15 @@ class TestFlockStatusResponse:
         assert unpacked.nfc_detection_count == 8
         assert unpacked.wips_alert_count == 3
 
+    def test_status_response_reports_subghz_and_ble(self):
+        """Test both SubGHz and BLE scanners have fields in the status response."""
+        names = {f.name for f in fields(FlockStatusResponse)}
+
+        assert 'subghz_ready' in names, "Status should have subghz_ready"
+        assert 'ble_ready' in names, "Status should have ble_ready"
+        assert 'subghz_detection_count' in names, "Status should have subghz_detection_count"
+        assert 'ble_scan_count' in names, "Status should have ble_scan_count"
+
 
 class TestFlockWifiNetwork:
     """Tests for WiFi network structure encoding/decoding."""
@@ -325,6 +342,24 @@ class TestFlockWifiNetwork:
         unpacked = FlockWifiNetwork.unpack(packed)
         assert len(unpacked.ssid) <= 32
 
+    def test_wifi_network_non_ascii_ssid(self):
+        """Test non-ASCII SSIDs decode as UTF-8 and invalid bytes are replaced."""
+        network = FlockWifiNetwork(ssid="Café_Wi-Fi")
+        assert FlockWifiNetwork.unpack(network.pack()).ssid == "Café_Wi-Fi"
+
+        packed = bytearray(network.pack())
+        packed[0:4] = b"\xffBad"
+        assert FlockWifiNetwork.unpack(bytes(packed)).ssid.startswith("�Bad")
+
+    def test_wifi_network_unpack_at_offset(self):
+        """Test unpacking in place from a memoryview at a record offset."""
+        original = FlockWifiNetwork(ssid="Offset", bssid=b"\x01\x02\x03\x04\x05\x06", rssi=-40)
+        data = memoryview(b"\xee" * 5 + original.pack())
+        unpacked = FlockWifiNetwork.unpack(data, 5)
+        assert unpacked == original
+        with pytest.raises(ValueError):
+            FlockWifiNetwork.unpack(data, 6)
+
 
 class TestFlockSubGhzDetection:
     """Tests for Sub-GHz detection structure encoding/decoding."""
@@ -466,6 +501,41 @@ class TestFlockMessageBuffer:
         # Should recover and find the valid heartbeat
         assert len(messages) >= 1
 
+    def test_buffer_resync_between_messages(self):
+        """Test buffer resyncs on garbage between complete messages."""
+        buffer = FlockMessageBuffer()
+        buffer.append(FlockProtocol.create_heartbeat())
+        buffer.append(bytes([0x99, 0x01, 0x00, 0xFF, 0xFF]))
+        buffer.append(FlockProtocol.create_wifi_probe("TestNet"))
+        messages = buffer.get_messages()
+        assert [h.msg_type for h, _ in messages] == [
+            FlockMessageType.HEARTBEAT, FlockMessageType.WIFI_PROBE_TX
+        ]
+        assert len(buffer.buffer) == 0
+
+    def test_buffer_discards_garbage_without_version_byte(self):
+        """Test a garbage run with no version byte is dropped in full."""
+        buffer = FlockMessageBuffer()
+        buffer.append(bytes([0x99, 0x00, 0xFF]) * 300)
+        assert buffer.get_messages() == []
+        assert len(buffer.buffer) == 0
+        buffer.append(FlockProtocol.create_heartbeat())
+        assert len(buffer.get_messages()) == 1
+
+    def test_buffer_stream_in_odd_chunks(self):
+        """Test frames split across many appends come out whole and in order."""
+        buffer = FlockMessageBuffer()
+        frames = [FlockProtocol.create_wifi_probe(f"Net{i}") for i in range(200)]
+        stream = b''.join(frames)
+        messages = []
+        for i in range(0, len(stream), 7):
+            buffer.append(stream[i:i + 7])
+            messages.extend(buffer.get_messages())
+        assert [FLOCK_HEADER_SIZE + h.payload_length for h, _ in messages] == \
+            [len(f) for f in frames]
+        assert [p for _, p in messages] == [f[FLOCK_HEADER_SIZE:] for f in frames]
+        assert len(buffer.buffer) == 0
+
     def test_buffer_clear(self):
         """Test buffer clear."""
         buffer = FlockMessageBuffer()
@@ -526,6 +596,28 @@ class TestFlockWipsAlert:
         assert original.description in unpacked.description or unpacked.description in original.description
 
 
+class TestRecordLayouts:
+    """Tests that record packing always produces exactly SIZE bytes."""
+
+    @pytest.mark.parametrize("record", [
+        FlockWifiNetwork(ssid="S" * 40, bssid=bytes(9)),
+        FlockSubGhzDetection(protocol_name="P" * 20),
+        FlockBleDevice(mac_address=bytes(8), name="N" * 40, service_uuids=[bytes(20)] * 6,
+                       service_uuid_count=6, manufacturer_id=bytes(3),
+                       manufacturer_data=bytes(40), manufacturer_data_len=40),
+        FlockIrDetection(protocol_name="P" * 20),
+        FlockNfcDetection(uid=bytes(12), atqa=bytes(3), type_name="T" * 20),
+        FlockStatusResponse(),
+        FlockWipsAlert(ssid="S" * 40, bssids=[bytes(8)] * 6, bssid_count=6,
+                       description="D" * 80),
+    ], ids=lambda record: type(record).__name__)
+    def test_oversized_fields_pack_to_declared_size(self, record):
+        """Test overlong strings and byte fields are truncated, never widening the record."""
+        packed = record.pack()
+        assert len(packed) == type(record).SIZE
+        type(record).unpack(packed)
+
+
 class TestParseResults:
     """Tests for result parsing functions."""
 
@@ -547,6 +639,63 @@ class TestParseResults:
         assert parsed_networks[0].ssid == "Net1"
         assert parsed_networks[1].ssid == "Net2"
 
+    def test_parse_wifi_result_raw_matches_objects(self):
+        """Test the numpy WiFi fast path decodes the same fields as the object path."""
+        pytest.importorskip("numpy")
+        networks = [
+            FlockWifiNetwork(ssid="Net1", bssid=b"\xaa\xbb\xcc\x00\x00\x00", rssi=-50, channel=1,
+                             security=WifiSecurityType.WPA2),
+            FlockWifiNetwork(ssid="Net2", rssi=-70, channel=6, hidden=True),
+        ]
+        # Declared count exceeds the records present; both paths stop at the tail
+        payload = struct.pack('<IB', 12345, 3) + b''.join(net.pack() for net in networks)
+
+        ts, records = FlockProtocol.parse_wifi_result_raw(payload)
+        _, parsed = FlockProtocol.parse_wifi_result(payload)
+        assert ts == 12345
+        assert len(records) == len(parsed) == 2
+        for record, net in zip(records, parsed):
+            assert record['ssid'].decode() == net.ssid
+            assert bytes(record['bssid']) == net.bssid
+            assert record['rssi'] == net.rssi
+            assert record['channel'] == net.channel
+            assert record['security'] == net.security
+            assert bool(record['hidden']) == net.hidden
+
+    def test_parse_ble_result_columns(self):
+        """Test column filters on BLE results and on-demand device construction."""
+        pytest.importorskip("numpy")
+        near = FlockBleDevice(mac_address=b"\x01\x02\x03\x04\x05\x06", name="Near", rssi=-45,
+                              service_uuids=[bytes(range(16))], service_uuid_count=1)
+        far = FlockBleDevice(name="Far", rssi=-95)
+        payload = struct.pack('<IB', 777, 2) + near.pack() + far.pack()
+
+        ts, devices = FlockProtocol.parse_ble_result_columns(payload)
+        assert ts == 777
+        assert len(devices) == 2
+        assert list(devices['rssi']) == [-45, -95]
+
+        strong = devices[devices['rssi'] > -70]
+        assert len(strong) == 1
+        assert strong[0] == near
+        assert [device.name for device in devices] == ["Near", "Far"]
+
+    def test_decode_payload_dispatches_by_type(self):
+        """Test decode_payload picks the parser from the message type."""
+        buffer = FlockMessageBuffer()
+        buffer.append(FlockProtocol.create_message(
+            FlockMessageType.STATUS_RESPONSE, FlockStatusResponse(battery_percent=42).pack()
+        ))
+        buffer.append(FlockProtocol.create_error(FlockErrorCode.BUSY, "busy"))
+        (status_header, status_payload), (error_header, error_payload) = buffer.get_messages()
+
+        status = FlockProtocol.decode_payload(status_header.msg_type, status_payload)
+        assert status.battery_percent == 42
+        assert FlockProtocol.decode_payload(error_header.msg_type, error_payload) == \
+            (FlockErrorCode.BUSY, "busy")
+        with pytest.raises(ValueError, match="No payload decoder"):
+            FlockProtocol.decode_payload(FlockMessageType.HEARTBEAT, b"")
+
     def test_parse_subghz_result(self):
         """Test Sub-GHz result parsing."""
         timestamp = 54321
@@ -581,6 +730,358 @@ class TestParseResults:
         assert len(parsed) == 1
         assert parsed[0].sak == 0x08
 
+    def test_parse_subghz_result_columns(self):
+        """Test the numpy Sub-GHz path matches the object path field for field."""
+        pytest.importorskip("numpy")
+        detections = [
+            FlockSubGhzDetection(frequency=433920000, rssi=-40, modulation=SubGhzModulation.FSK,
+                                 duration_ms=1200, bandwidth=650000, protocol_id=7,
+                                 protocol_name="Princeton"),
+            FlockSubGhzDetection(frequency=315000000, rssi=-80),
+        ]
+        payload = struct.pack('<IIIB', 5, 300000000, 928000000, 2) + \
+            b''.join(det.pack() for det in detections)
+
+        ts, fs, fe, records = FlockProtocol.parse_subghz_result_columns(payload)
+        assert (ts, fs, fe) == (5, 300000000, 928000000)
+        assert list(records['frequency']) == [433920000, 315000000]
+        assert list(records) == FlockProtocol.parse_subghz_result(payload)[3]
+
+    def test_parse_nfc_result_columns(self):
+        """Test the numpy NFC path matches the object path field for field."""
+        pytest.importorskip("numpy")
+        detections = [
+            FlockNfcDetection(uid=bytes(range(1, 11)), uid_len=7, nfc_type=2, sak=0x20,
+                              atqa=b"\x44\x00", type_name="DESFire"),
+            FlockNfcDetection(uid_len=4, sak=0x08, type_name="Classic"),
+        ]
+        payload = struct.pack('<IB', 99, 2) + b''.join(det.pack() for det in detections)
+
+        ts, records = FlockProtocol.parse_nfc_result_columns(payload)
+        assert ts == 99
+        assert list(records['sak']) == [0x20, 0x08]
+        assert list(records) == FlockProtocol.parse_nfc_result(payload)[1]
+
+    def test_create_scan_results_roundtrip(self):
+        """Test the result encoders produce frames the parsers read back."""
+        networks = [FlockWifiNetwork(ssid=f"Net{i}", rssi=-40 - i, channel=i % 13 + 1)
+                    for i in range(20)]
+        subghz = [FlockSubGhzDetection(frequency=433920000, rssi=-40, protocol_name="Test")]
+        nfc = [FlockNfcDetection(uid_len=4, sak=0x08, type_name="Classic")]
+
+        header, payload = FlockProtocol.parse_message(
+            FlockProtocol.create_wifi_scan_result(1, networks))
+        assert header.msg_type == FlockMessageType.WIFI_SCAN_RESULT
+        assert FlockProtocol.parse_wifi_result(payload) == (1, networks)
+
+        header, payload = FlockProtocol.parse_message(
+            FlockProtocol.create_subghz_scan_result(2, 300000000, 928000000, subghz))
+        assert header.msg_type == FlockMessageType.SUBGHZ_SCAN_RESULT
+        assert FlockProtocol.parse_subghz_result(payload) == (2, 300000000, 928000000, subghz)
+
+        header, payload = FlockProtocol.parse_message(FlockProtocol.create_nfc_scan_result(3, nfc))
+        assert header.msg_type == FlockMessageType.NFC_SCAN_RESULT
+        assert FlockProtocol.parse_nfc_result(payload) == (3, nfc)
+
+    def test_parse_result_ignores_partial_trailing_record(self):
+        """Test a declared count beyond the payload yields only whole records."""
+        device = FlockBleDevice(name="Tag", rssi=-60)
+        payload = struct.pack('<IB', 1, 3) + device.pack() + device.pack()[:50]
+
+        ts, parsed = FlockProtocol.parse_ble_result(payload)
+        assert ts == 1
+        assert len(parsed) == 1
+        assert parsed[0].name == "Tag"
+
+
+class _FakeSerial:
+    """In-memory stand-in for serial.Serial on the rx thread's read(1)/in_waiting path."""
+
+    def __init__(self, connection, rx_data: bytes = b''):
+        self.connection = connection
+        self.is_open = True
+        self.rx = bytearray(rx_data)
+        self.written = bytearray()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.rx)
+
+    def read(self, size: int = 1) -> bytes:
+        if not self.rx:
+            # Drained: let a synchronously driven _rx_loop return
+            self.connection._running = False
+            return b''
+        data = bytes(self.rx[:size])
+        del self.rx[:size]
+        return data
+
+    def write(self, data: bytes) -> int:
+        self.written += data
+        return len(data)
+
+    def reset_input_buffer(self) -> None:
+        self.rx.clear()
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class TestFlipperConnectionPending:
+    """Tests for send_async response matching in FlipperConnection."""
+
+    @pytest.fixture
+    def connection(self):
+        conn = FlipperConnection(port="/dev/null", auto_reconnect=False)
+        conn._serial = _FakeSerial(conn)
+        return conn
+
+    @staticmethod
+    def _feed(conn, *messages):
+        """Run the rx loop in this thread over the given frames until it drains."""
+        conn._serial.rx += b''.join(messages)
+        conn._running = True
+        conn._rx_loop()
+
+    def test_responses_complete_requests_in_send_order(self, connection):
+        """Test same-typed responses resolve pending requests oldest first."""
+        first = connection.send_async(FlockMessageType.STATUS_REQUEST,
+                                      expected_type=FlockMessageType.STATUS_RESPONSE)
+        second = connection.send_async(FlockMessageType.STATUS_REQUEST,
+                                       expected_type=FlockMessageType.STATUS_RESPONSE)
+        assert bytes(connection._serial.written) == FlockProtocol.create_status_request() * 2
+
+        self._feed(connection,
+                   FlockProtocol.create_message(FlockMessageType.STATUS_RESPONSE,
+                                                FlockStatusResponse(battery_percent=10).pack()),
+                   FlockProtocol.create_message(FlockMessageType.STATUS_RESPONSE,
+                                                FlockStatusResponse(battery_percent=20).pack()))
+        assert FlockStatusResponse.unpack(first.result(timeout=0)[1]).battery_percent == 10
+        assert FlockStatusResponse.unpack(second.result(timeout=0)[1]).battery_percent == 20
+
+    def test_response_skips_requests_expecting_other_types(self, connection):
+        """Test a response resolves the oldest request whose expected type it matches."""
+        status = connection.send_async(FlockMessageType.STATUS_REQUEST,
+                                       expected_type=FlockMessageType.STATUS_RESPONSE)
+        heartbeat = connection.send_async(FlockMessageType.HEARTBEAT,
+                                          expected_type=FlockMessageType.HEARTBEAT)
+
+        self._feed(connection, FlockProtocol.create_heartbeat())
+        assert heartbeat.result(timeout=0)[0].msg_type == FlockMessageType.HEARTBEAT
+        assert not status.done()
+
+    def test_cancelled_and_timed_out_requests_are_pruned(self, connection):
+        """Test abandoned requests never claim a later response."""
+        with pytest.raises(FlipperTimeoutError):
+            connection.send_and_receive(FlockMessageType.HEARTBEAT,
+                                        expected_type=FlockMessageType.HEARTBEAT, timeout=0.01)
+        cancelled = connection.send_async(FlockMessageType.HEARTBEAT,
+                                          expected_type=FlockMessageType.HEARTBEAT)
+        assert cancelled.cancel()
+        live = connection.send_async(FlockMessageType.HEARTBEAT,
+                                     expected_type=FlockMessageType.HEARTBEAT)
+
+        self._feed(connection, FlockProtocol.create_heartbeat())
+        assert live.result(timeout=0)[0].msg_type == FlockMessageType.HEARTBEAT
+        assert connection._pending_responses == []
+        assert connection.receive(timeout=0) is None
+
+    def test_sync_timeout_leaves_no_pending_heartbeat(self, connection):
+        """Test a silent FAP at connect doesn't let the sync swallow a later heartbeat."""
+        connection.SYNC_TIMEOUT = 0.01
+        connection._sync_stream()
+
+        self._feed(connection, FlockProtocol.create_heartbeat())
+        header, _ = connection.receive(timeout=0)
+        assert header.msg_type == FlockMessageType.HEARTBEAT
+        assert connection._pending_responses == []
+
+    def test_sync_timeout_drops_stale_partial_header(self, connection):
+        """Test a failed sync flushes a stale tail that parses as a header."""
+        # Valid header claiming a 256-byte payload that never arrives
+        self._feed(connection, b'\x01\x02\x00\x01')
+        connection.SYNC_TIMEOUT = 0.01
+        connection._sync_stream()
+
+        self._feed(connection, FlockProtocol.create_heartbeat() * 3)
+        header, _ = connection.receive(timeout=0)
+        assert header.msg_type == FlockMessageType.HEARTBEAT
+        assert connection._message_buffer.buffer == bytearray()
+
+    def test_error_fails_oldest_request(self, connection):
+        """Test an ERROR response fails the oldest pending request only."""
+        oldest = connection.send_async(FlockMessageType.WIFI_SCAN_REQUEST,
+                                       expected_type=FlockMessageType.WIFI_SCAN_RESULT)
+        newer = connection.send_async(FlockMessageType.STATUS_REQUEST,
+                                      expected_type=FlockMessageType.STATUS_RESPONSE)
+
+        self._feed(connection, FlockProtocol.create_error(FlockErrorCode.BUSY, "busy"))
+        with pytest.raises(FlipperConnectionError, match="BUSY: busy"):
+            oldest.result(timeout=0)
+        assert not newer.done()
+
+    @pytest.mark.parametrize("error_payload", [b"", b"\x7f"])
+    def test_malformed_error_completes_request(self, connection, error_payload):
+        """Test an unparseable ERROR still fails its request and spares the rest of the batch."""
+        future = connection.send_async(FlockMessageType.STATUS_REQUEST,
+                                       expected_type=FlockMessageType.STATUS_RESPONSE)
+
+        self._feed(connection,
+                   FlockProtocol.create_message(FlockMessageType.ERROR, error_payload),
+                   FlockProtocol.create_heartbeat())
+        with pytest.raises(FlipperConnectionError, match="Malformed error response"):
+            future.result(timeout=0)
+        header, _ = connection.receive(timeout=0)
+        assert header.msg_type == FlockMessageType.HEARTBEAT
+
+    def test_unmatched_messages_go_to_receive(self, connection):
+        """Test messages no pending request claims are queued for receive()."""
+        future = connection.send_async(FlockMessageType.STATUS_REQUEST,
+                                       expected_type=FlockMessageType.STATUS_RESPONSE)
+
+        self._feed(connection, FlockProtocol.create_heartbeat())
+        header, payload = connection.receive(timeout=0)
+        assert header.msg_type == FlockMessageType.HEARTBEAT
+        assert payload == b""
+        assert not future.done()
+        assert connection._resolve_pending(header, payload) is False
+
+    def test_flush_drops_bytes_already_read(self, connection):
+        """Test the rx loop carries out a pending flush, including the burst it just read."""
+        done = threading.Event()
+        connection._flush_waiters.append(done)
+
+        self._feed(connection, FlockProtocol.create_heartbeat(), b"\x01\x02")
+        assert done.is_set()
+        assert connection.receive(timeout=0) is None
+        assert connection._message_buffer.buffer == bytearray()
+
+    def test_flush_input_without_rx_thread_flushes_inline(self, connection):
+        """Test flush_input does not wait when no rx thread is running."""
+        connection._serial.rx += b"\x01\x02"
+        connection._message_buffer.append(b"\x01")
+        connection._rx_queue.append((None, b""))
+
+        connection.flush_input()
+        assert connection._serial.rx == bytearray()
+        assert connection._message_buffer.buffer == bytearray()
+        assert connection.receive(timeout=0) is None
+
+
+class _StubTransport:
+    """Records writes in place of the pyserial-asyncio transport."""
+
+    def __init__(self):
+        self.written = bytearray()
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.written += data
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestAsyncFlipperConnection:
+    """Tests for AsyncFlipperConnection routing over a stub transport."""
+
+    @staticmethod
+    def _run(test):
+        """Run test(connection) on a fresh event loop with a connected stub transport."""
+        async def main():
+            conn = AsyncFlipperConnection(port="/dev/null")
+            conn._transport = _StubTransport()
+            conn._rx_queue = asyncio.Queue()
+            return await test(conn)
+        return asyncio.run(main())
+
+    def test_send_and_receive_resolves_in_send_order(self):
+        """Test concurrent requests are answered oldest first."""
+        async def test(conn):
+            requests = [asyncio.ensure_future(conn.send_and_receive(
+                FlockMessageType.STATUS_REQUEST, expected_type=FlockMessageType.STATUS_RESPONSE))
+                for _ in range(2)]
+            await asyncio.sleep(0)
+            assert bytes(conn._transport.written) == FlockProtocol.create_status_request() * 2
+
+            conn._on_data(b''.join(
+                FlockProtocol.create_message(FlockMessageType.STATUS_RESPONSE,
+                                             FlockStatusResponse(battery_percent=level).pack())
+                for level in (10, 20)))
+            responses = await asyncio.gather(*requests)
+            assert [FlockStatusResponse.unpack(payload).battery_percent
+                    for _, payload in responses] == [10, 20]
+            assert conn._pending_responses == []
+        self._run(test)
+
+    def test_unmatched_messages_go_to_receive(self):
+        """Test frames no request claims are queued for receive()."""
+        async def test(conn):
+            conn._on_data(FlockProtocol.create_heartbeat())
+            header, payload = await conn.receive(timeout=0.1)
+            assert header.msg_type == FlockMessageType.HEARTBEAT
+            assert await conn.receive(timeout=0.01) is None
+        self._run(test)
+
+    def test_timeout_removes_pending_request(self):
+        """Test a timed-out request does not claim a later response."""
+        async def test(conn):
+            with pytest.raises(FlipperTimeoutError):
+                await conn.send_and_receive(FlockMessageType.HEARTBEAT,
+                                            expected_type=FlockMessageType.HEARTBEAT, timeout=0.01)
+            assert conn._pending_responses == []
+            conn._on_data(FlockProtocol.create_heartbeat())
+            assert (await conn.receive(timeout=0.1))[0].msg_type == FlockMessageType.HEARTBEAT
+        self._run(test)
+
+    @pytest.mark.parametrize("error_payload, match", [
+        (bytes((FlockErrorCode.BUSY,)) + b"busy", "BUSY: busy"),
+        (b"\x7f", "Malformed error response"),
+    ])
+    def test_error_fails_oldest_request(self, error_payload, match):
+        """Test ERROR (even a malformed one) fails the oldest request and spares the batch."""
+        async def test(conn):
+            request = asyncio.ensure_future(conn.send_and_receive(
+                FlockMessageType.WIFI_SCAN_REQUEST, expected_type=FlockMessageType.WIFI_SCAN_RESULT))
+            await asyncio.sleep(0)
+
+            conn._on_data(FlockProtocol.create_message(FlockMessageType.ERROR, error_payload) +
+                          FlockProtocol.create_heartbeat())
+            with pytest.raises(FlipperConnectionError, match=match):
+                await request
+            assert (await conn.receive(timeout=0.1))[0].msg_type == FlockMessageType.HEARTBEAT
+        self._run(test)
+
+    def test_connection_lost_fails_pending_requests(self):
+        """Test transport loss fails waiters and disconnects."""
+        async def test(conn):
+            request = asyncio.ensure_future(conn.send_and_receive(
+                FlockMessageType.HEARTBEAT, expected_type=FlockMessageType.HEARTBEAT))
+            await asyncio.sleep(0)
+
+            conn._on_connection_lost(OSError("unplugged"))
+            with pytest.raises(FlipperConnectionError, match="Connection lost"):
+                await request
+            assert not conn.is_connected()
+            with pytest.raises(FlipperConnectionError, match="Not connected"):
+                conn.send(FlockProtocol.create_heartbeat())
+        self._run(test)
+
+    def test_failing_abandoned_request_logs_nothing(self):
+        """Test a failed future nobody awaits does not report an unretrieved exception."""
+        async def test(conn):
+            loop = asyncio.get_running_loop()
+            reports = []
+            loop.set_exception_handler(lambda _, context: reports.append(context))
+            conn._pending_responses.append((None, loop.create_future()))
+
+            conn._on_connection_lost(None)
+            gc.collect()
+            return reports
+        assert self._run(test) == []
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])